@@ -6,9 +6,11 @@ import sys
 import csv
 import time
 import textwrap
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
-from multiprocessing import Process, Queue, Event, Value, freeze_support
+from typing import List, Dict, Any, Optional, Tuple, Deque
+from multiprocessing import Process, Queue, Event, freeze_support
 import queue
 import os
 try:
@@ -28,6 +30,7 @@ from PySide6.QtWidgets import (
     QTextEdit,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
     QAbstractItemView,
     QHeaderView,
     QFileDialog,
@@ -39,7 +42,7 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QDialog,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QPointF, QThread, QTimer
 from PySide6.QtGui import QFontMetrics, QPalette, QColor, QPainter, QFont
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
 
@@ -48,27 +51,37 @@ from device_comm import (
     K2_TARGET_VID,
     K2_TARGET_PID,
     data_collection_worker,
-    enumerate_devices,
-)
-from pd_decoder import (
-    CableDataParser,
-    PDParser,
-    is_pdo_packet,
-    is_rdo_packet,
+    decode_payload,
 )
+from csv_import import CSV_BUFFER_SIZE, CSV_HEADER_KEYS, CSV_MEASUREMENT_HEADERS, CsvImportWorker
+from device_enum import DeviceEnumWorker
+from downsample import lttb_indices
+from frame_ring import FrameRing
+from log_model import LogRecord, LogTableModel, MeasurementRecord
 from i18n import (
+    CABLE_FIELD_TEXT,
+    CABLE_VALUE_TEXT,
+    DEFAULT_LANGUAGE,
     LANG_STRINGS,
-    get_text,
-    translate_cable_field,
-    translate_cable_value,
 )
 
+WRAP_CACHE_LIMIT = 4096  # 摘要换行缓存的最大条目数
+RAW_RECORD_LIMIT = 50000  # 原始记录默认上限，超出后丢弃最早的记录
+UI_UPDATE_MAX_INTERVAL_MS = 200  # 批量刷新UI的最长等待时间
+UI_UPDATE_MIN_INTERVAL_MS = 30  # 积压较多时的最短等待时间
+UI_BATCH_ROWS = 500  # 每轮批量刷新最多插入表格的PD记录数
+CHART_MIN_POINTS = 500  # 图表降采样后每条曲线至少保留的点数
+DEVICE_ENUM_TTL_S = 5.0  # HID 枚举结果的缓存有效期（秒）
+
 STATUS_COLORS = {
     "status_disconnected": "#bbbbbb",
     "status_connected": "#3fc1c9",
     "status_collecting": "#4fd3c4",
     "status_paused": "#ffa931",
 }
+# 状态标签样式表在模块加载时生成一次，状态切换时直接复用
+STATUS_STYLESHEETS = {key: f"color: {color};" for key, color in STATUS_COLORS.items()}
+AUTO_PAUSED_STYLESHEET = "color: #ff5555;"
 
 class PDViewerWindow(QMainWindow):
     def __init__(self):
@@ -76,14 +89,22 @@ class PDViewerWindow(QMainWindow):
         self.resize(1280, 720)
 
         self.current_language = "zh"
+        self._applied_language: Optional[str] = None  # _apply_language 最近一次应用的语言
+        self._fallback_map: Dict[str, str] = LANG_STRINGS[DEFAULT_LANGUAGE]
+        self._lang_map: Dict[str, str] = self._fallback_map
+        self._text_cache: Dict[str, str] = {}  # 当前语言下已解析的文本（含回退）
+        self._refresh_language_maps()
         self.current_status_key = "status_disconnected"
 
         self.device_open = False
         self.is_paused = True
-        self.log_records: List[Dict[str, Any]] = []
         self.log_index = 0
         self.start_time: Optional[float] = None
         self.cable_info_rows: List[Tuple[str, Any]] = []
+        self._last_pdo_entries: List[Dict[str, str]] = []  # 当前PDO表显示的内容，用于增量更新
+        # 详细信息区当前显示的记录及语言；同一记录重复触发选择变化时不再重新生成文本
+        self._detail_record: Optional[LogRecord] = None
+        self._detail_language: Optional[str] = None
 
         self.summary_wrap_chars = 30
         self.summary_max_lines = 4
@@ -92,25 +113,57 @@ class PDViewerWindow(QMainWindow):
         self.summary_base_padding = 6
         self.summary_metrics: Optional[QFontMetrics] = None
         self.current_max_lines = 1
+        # 摘要换行结果缓存：同一列宽下相同摘要只换行一次（PDO摘要大量重复）
+        self._wrap_cache: Dict[str, str] = {}
+        self._wrap_cache_key: Tuple[int, int] = (0, 0)
         self._updating_summary = False
+        # 拖动列宽时合并重排：停止拖动后才对全部记录重新换行
+        self._summary_wrap_timer = QTimer(self)
+        self._summary_wrap_timer.setSingleShot(True)
+        self._summary_wrap_timer.setInterval(100)
+        self._summary_wrap_timer.timeout.connect(self._refresh_summary_wrapping)
+        self._table_view_dirty = False
+        self._table_columns_sized = False  # 前三列是否已按内容调整过宽度
 
         self.device_candidates: List[Dict[str, Any]] = []
+        # device_candidates 的标签/提示是按哪种语言生成的；语言未变时无需重新生成
+        self._device_labels_language: Optional[str] = None
+        # (monotonic 时间戳, hid.enumerate 结果)；有效期内重建设备列表时不再重新枚举
+        self._enum_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
         self.selected_device_value: Any = None
 
         self.collection_process: Optional[Process] = None
-        self.data_queue: Optional[Queue] = None
+        self.frame_ring: Optional[FrameRing] = None
+        self.control_queue: Optional[Queue] = None
         self.stop_event = None
-        self.pause_flag = None
+        self.pause_event = None
+        self.max_payloads_per_poll = 512  # 每次轮询最多处理的数据包数量
 
-        # 测量数据记录
-        self.measurement_records: List[Dict[str, Any]] = []
         self.measurement_index = 0
 
         # 滚动记录限制（UI显示的记录数，保证性能）
         self.ui_log_limit = 5000  # UI最多显示5000条PD记录
         self.ui_measurement_limit = 10000  # UI最多显示10000条测量记录
-        self.raw_log_records: List[Dict[str, Any]] = []  # 原始完整PD记录（用于导出）
-        self.raw_measurement_records: List[Dict[str, Any]] = []  # 原始完整测量记录
+        # 测量数据记录：定长环形缓冲，超限时自动丢弃最早的记录
+        self.measurement_records: Deque[MeasurementRecord] = deque(maxlen=self.ui_measurement_limit)
+        self._chart_dirty = True  # 测量数据自上次绘制图表后是否有变化
+        # 表格显示的PD记录；超限时由 log_model.remove_leading 先删除最早的行再追加，
+        # maxlen 只作为兜底上限
+        self.log_records: Deque[LogRecord] = deque(maxlen=self.ui_log_limit)
+        # 原始记录（用于导出）使用定长环形缓冲，长时间采集时内存有界；
+        # raw_record_limit 设为 None 则不限制（完整取证采集）
+        self.raw_record_limit: Optional[int] = RAW_RECORD_LIMIT
+        self.raw_log_records: Deque[LogRecord] = deque(maxlen=self.raw_record_limit)  # 原始PD记录
+        self.raw_measurement_records: Deque[MeasurementRecord] = deque(maxlen=self.raw_record_limit)  # 原始测量记录
+        self.raw_records_dropped = 0  # 因上限被丢弃的原始记录数，导出时提示用户
+
+        # CSV 后台导入
+        self._import_thread: Optional[QThread] = None
+        self._import_worker: Optional[CsvImportWorker] = None
+        # 后台HID枚举（同一时间最多一个）
+        self._enum_thread: Optional[QThread] = None
+        self._enum_worker: Optional[DeviceEnumWorker] = None
+        self._connect_after_enum = False  # 枚举完成后是否继续之前被推迟的连接
 
         # 自动暂停阈值设置
         self.auto_pause_threshold_enabled = False
@@ -130,11 +183,13 @@ class PDViewerWindow(QMainWindow):
         self.auto_pause_delay_timer.timeout.connect(self._execute_pending_auto_pause)
 
         # 批量UI更新相关
-        self.pending_records: List[Dict[str, Any]] = []  # 待添加的PD记录
-        self.pending_measurements: List[Dict[str, Any]] = []  # 待添加的测量记录
+        self.pending_records: List[LogRecord] = []  # 待添加的PD记录
+        self.pending_measurements: List[MeasurementRecord] = []  # 待添加的测量记录
+        # 单次触发：只在轮询到新数据后才安排一次批量刷新，没有数据时不唤醒
         self.ui_update_timer = QTimer(self)
+        self.ui_update_timer.setSingleShot(True)
         self.ui_update_timer.timeout.connect(self._batch_update_ui)
-        self.ui_update_timer.setInterval(200)  # 每200ms批量更新一次UI
+        self.ui_update_timer.setInterval(UI_UPDATE_MAX_INTERVAL_MS)
 
         # 内存监控相关
         self.memory_check_timer = QTimer(self)
@@ -142,42 +197,34 @@ class PDViewerWindow(QMainWindow):
         self.memory_check_timer.setInterval(5000)  # 每5秒检查一次
         self.memory_warning_shown = False
         self.memory_threshold_mb = 500  # 500MB警告阈值
+        # 进程句柄只创建一次，定时检查时直接复用
+        self._memory_process = psutil.Process(os.getpid()) if PSUTIL_AVAILABLE else None
 
         self._build_ui()
         self._populate_device_list()
         self._apply_language()
 
+        # 轮询定时器只在设备连接期间运行，未连接时不产生空闲唤醒
         self.poll_timer = QTimer(self)
         self.poll_timer.timeout.connect(self._poll_queue)
-        self.poll_timer.start(50)
-
-        # 启动批量UI更新定时器
-        self.ui_update_timer.start()
+        self.poll_timer.setInterval(50)
 
-        # 启动内存监控定时器
-        self.memory_check_timer.start()
+        # 启动内存监控定时器（没有 psutil 时不启动）
+        if self._memory_process is not None:
+            self.memory_check_timer.start()
 
     def _check_memory_usage(self):
         """检查内存使用，超过阈值时发出警告"""
         try:
-            if not PSUTIL_AVAILABLE:
+            if self._memory_process is None:
                 return
 
-            process = psutil.Process(os.getpid())
-            mem_info = process.memory_info()
+            mem_info = self._memory_process.memory_info()
             mem_mb = mem_info.rss / 1024 / 1024  # 转换为MB
 
-            # 更新状态栏显示内存使用
-            if hasattr(self, 'statusBar'):
-                # 查找或创建内存标签
-                status_bar = self.statusBar()
-                if not hasattr(self, '_memory_label'):
-                    # 添加分隔符
-                    status_bar.addPermanentWidget(QLabel(" | "))
-                    self._memory_label = QLabel(f"RAM: {mem_mb:.0f}MB")
-                    status_bar.addPermanentWidget(self._memory_label)
-                else:
-                    self._memory_label.setText(f"RAM: {mem_mb:.0f}MB")
+            # 更新状态栏显示内存使用（数值没变时不重设文本）
+            if self._memory_label is not None:
+                self._set_label_text(self._memory_label, f"RAM: {mem_mb:.0f}MB")
 
             # 检查是否超过阈值
             if mem_mb > self.memory_threshold_mb and not self.memory_warning_shown:
@@ -194,66 +241,90 @@ class PDViewerWindow(QMainWindow):
             # 如果内存监控失败，忽略错误
             pass
 
+    def _refresh_language_maps(self) -> None:
+        """缓存当前语言的字符串表，语言切换时刷新"""
+        self._lang_map = LANG_STRINGS.get(self.current_language, self._fallback_map)
+        self._text_cache.clear()
+        # 线缆字段/取值的翻译展开为当前语言的单层字典
+        language = self.current_language
+        self._cable_field_map = {key: texts.get(language, key) for key, texts in CABLE_FIELD_TEXT.items()}
+        self._cable_value_map = {key: texts.get(language, key) for key, texts in CABLE_VALUE_TEXT.items()}
+        # 高频刷新的文本模板预先绑定 format，避免每次刷新都查表
+        self._fmt_records_count = self._text("records_count").format
+        self._fmt_measurement_count = self._text("measurement_count").format
+        self._fmt_measurement_display = self._text("measurement_display").format
+
     def _text(self, key: str, **kwargs) -> str:
-        return get_text(self.current_language, key, **kwargs)
+        text = self._text_cache.get(key)
+        if text is None:
+            text = self._lang_map.get(key)
+            if text is None:
+                text = self._fallback_map.get(key, key)
+            self._text_cache[key] = text
+        if kwargs:
+            try:
+                text = text.format(**kwargs)
+            except Exception:
+                pass
+        return text
+
+    @contextmanager
+    def _updates_suspended(self):
+        """暂停窗口重绘；可嵌套，只有最外层负责恢复"""
+        was_enabled = self.updatesEnabled()
+        if was_enabled:
+            self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            if was_enabled:
+                self.setUpdatesEnabled(True)
 
     def _apply_language(self) -> None:
-        self.setWindowTitle(self._text("app_title"))
-        if hasattr(self, "device_label"):
-            self.device_label.setText(self._text("label_device"))
-        if hasattr(self, "refresh_devices_btn"):
-            self.refresh_devices_btn.setText(self._text("btn_refresh_devices"))
-        if hasattr(self, "clear_btn"):
-            self.clear_btn.setText(self._text("btn_clear"))
-        if hasattr(self, "export_btn"):
-            self.export_btn.setText(self._text("btn_export"))
-        if hasattr(self, "import_btn"):
-            self.import_btn.setText(self._text("btn_import"))
-        if hasattr(self, "auto_scroll_checkbox"):
-            self.auto_scroll_checkbox.setText(self._text("checkbox_auto_scroll"))
-        if hasattr(self, "cable_label"):
-            self.cable_label.setText(self._text("cable_title"))
-        if hasattr(self, "pdo_label"):
-            self.pdo_label.setText(self._text("pdo_title"))
-        if hasattr(self, "detail_label"):
-            self.detail_label.setText(self._text("detail_title"))
-        if hasattr(self, "records_label"):
-            self.records_label.setText(self._text("records_title"))
-        self._update_measurement_count_label()  # 更新测量数据计数显示
-
-        self._update_connect_button_text()
-        self._update_start_button_text()
-        self._set_status_message(self.current_status_key)
-        self._update_count_label()
-        self._update_table_headers()
-        self._update_cable_info(self.cable_info_rows)
-        self._refresh_device_selector_labels()
-
-        if hasattr(self, "data_visualization_checkbox"):
-            self.data_visualization_checkbox.setText(self._text("checkbox_data_visualization"))
-
-        if hasattr(self, "auto_pause_btn"):
-            self.auto_pause_btn.setText(self._text("btn_auto_pause_settings"))
+        # 已按当前语言设置过全部文本时直接返回（界面建好后首次调用前为 None）
+        if self._applied_language == self.current_language:
+            return
+        self._applied_language = self.current_language
+        self._refresh_language_maps()
+        # 批量改写文本期间暂停重绘，结束后统一刷新一次
+        with self._updates_suspended():
+            self.setWindowTitle(self._text("app_title"))
+            for widget, key in getattr(self, "_lang_targets", ()):
+                widget.setText(self._text(key))
+            self._update_measurement_count_label()  # 更新测量数据计数显示
+
+            self._sync_buttons()
+            self._set_status_message(self.current_status_key)
+            self._update_count_label()
+            self._update_table_headers()
+            self._update_cable_info(self.cable_info_rows)
+            self._refresh_device_selector_labels()
 
-        # 更新图表翻译
-        self._update_chart_translations()
-        self._update_auto_pause_status_display()
+            # 更新图表翻译
+            self._update_chart_translations()
+            self._update_auto_pause_status_display()
 
-        if hasattr(self, "auto_pause_status_label"):
-            self.auto_pause_status_label.setToolTip(self._text("auto_pause_status_tooltip"))
+            if hasattr(self, "auto_pause_status_label"):
+                self.auto_pause_status_label.setToolTip(self._text("auto_pause_status_tooltip"))
+            if hasattr(self, "keep_all_records_checkbox"):
+                self.keep_all_records_checkbox.setToolTip(
+                    self._text("tooltip_keep_all_records", limit=RAW_RECORD_LIMIT)
+                )
 
-        if hasattr(self, "language_checkbox"):
-            self.language_checkbox.blockSignals(True)
-            self.language_checkbox.setChecked(self.current_language == "en")
-            self.language_checkbox.blockSignals(False)
+            if hasattr(self, "language_checkbox"):
+                self.language_checkbox.blockSignals(True)
+                self.language_checkbox.setChecked(self.current_language == "en")
+                self.language_checkbox.blockSignals(False)
 
     def _update_chart_translations(self) -> None:
         """更新图表的翻译文本"""
         if not hasattr(self, "unified_chart"):
             return
 
-        # 更新图表标题
-        self.unified_chart.setTitle(self._text("chart_title"))
+        # 更新图表标题（setTitle 会触发图例重新布局，标题未变时跳过）
+        title = self._text("chart_title")
+        if self.unified_chart.title() != title:
+            self.unified_chart.setTitle(title)
 
         # 更新X轴和Y轴标签
         if hasattr(self, "unified_axis_x"):
@@ -269,62 +340,40 @@ class PDViewerWindow(QMainWindow):
         if hasattr(self, "power_series"):
             self.power_series.setName(self._text("chart_power"))
 
-    def _update_connect_button_text(self) -> None:
-        if not hasattr(self, "connect_btn"):
-            return
-        text = self._text("btn_disconnect") if self.device_open else self._text("btn_connect")
-        self.connect_btn.setText(text)
-
-    def _update_start_button_text(self) -> None:
-        if not hasattr(self, "start_btn"):
-            return
-        if not self.device_open:
-            text = self._text("btn_start")
-        elif self.is_paused:
-            if self.start_time is None:
+    def _sync_buttons(self) -> None:
+        """根据连接/暂停状态同步连接与开始按钮文本，文本未变化时不调用 setText"""
+        if hasattr(self, "connect_btn"):
+            text = self._text("btn_disconnect") if self.device_open else self._text("btn_connect")
+            if self.connect_btn.text() != text:
+                self.connect_btn.setText(text)
+        if hasattr(self, "start_btn"):
+            if not self.device_open:
                 text = self._text("btn_start")
+            elif self.is_paused:
+                if self.start_time is None:
+                    text = self._text("btn_start")
+                else:
+                    text = self._text("btn_resume")
             else:
-                text = self._text("btn_resume")
-        else:
-            text = self._text("btn_pause")
-        self.start_btn.setText(text)
+                text = self._text("btn_pause")
+            if self.start_btn.text() != text:
+                self.start_btn.setText(text)
 
     def _refresh_device_selector_labels(self) -> None:
         if not hasattr(self, "device_selector"):
             return
+        if self._device_labels_language == self.current_language:
+            return
+        self._device_labels_language = self.current_language
         self.device_selector.blockSignals(True)
         for idx, entry in enumerate(self.device_candidates):
-            value = entry.get("value")
-            if value is None:
+            if entry.get("value") is None:
                 label = self._text("device_auto")
-                tooltip = self._text("tooltip_default_vidpid", vid=K2_TARGET_VID, pid=K2_TARGET_PID)
             else:
                 label = entry.get("label")
                 if not label or label.startswith("设备") or label.startswith("Device"):
                     label = self._text("device_fallback_label", index=max(1, idx))
-                vid = value.get("vid", K2_TARGET_VID)
-                pid = value.get("pid", K2_TARGET_PID)
-                tooltip_lines = [self._text("tooltip_vid_pid", vid=vid, pid=pid)]
-                manufacturer = value.get("manufacturer")
-                if manufacturer:
-                    tooltip_lines.append(self._text("tooltip_manufacturer", manufacturer=manufacturer))
-                product = value.get("product")
-                if product:
-                    tooltip_lines.append(self._text("tooltip_product", product=product))
-                serial = value.get("serial")
-                if serial:
-                    tooltip_lines.append(self._text("tooltip_serial", serial=serial))
-                path = value.get("path")
-                if isinstance(path, (bytes, bytearray)):
-                    try:
-                        path_display = path.decode("utf-8")
-                    except Exception:
-                        path_display = str(path)
-                else:
-                    path_display = str(path) if path is not None else ""
-                if path_display:
-                    tooltip_lines.append(self._text("tooltip_path", path=path_display))
-                tooltip = "\n".join(line for line in tooltip_lines if line)
+            tooltip = self._render_entry_tooltip(entry)
             entry["label"] = label
             entry["tooltip"] = tooltip
             if idx < self.device_selector.count():
@@ -333,32 +382,64 @@ class PDViewerWindow(QMainWindow):
                     self.device_selector.setItemData(idx, tooltip, Qt.ToolTipRole)
         self.device_selector.blockSignals(False)
 
+    def _render_entry_tooltip(self, entry: Dict[str, Any]) -> str:
+        """按当前语言生成设备提示文本；原始字段和路径文本在枚举时已准备好"""
+        value = entry.get("value")
+        if value is None:
+            return self._text("tooltip_default_vidpid", vid=K2_TARGET_VID, pid=K2_TARGET_PID)
+        tooltip_lines = [self._text("tooltip_vid_pid", vid=value.get("vid", K2_TARGET_VID), pid=value.get("pid", K2_TARGET_PID))]
+        manufacturer = value.get("manufacturer")
+        if manufacturer:
+            tooltip_lines.append(self._text("tooltip_manufacturer", manufacturer=manufacturer))
+        product = value.get("product")
+        if product:
+            tooltip_lines.append(self._text("tooltip_product", product=product))
+        serial = value.get("serial")
+        if serial:
+            tooltip_lines.append(self._text("tooltip_serial", serial=serial))
+        path_display = entry.get("path_display")
+        if path_display:
+            tooltip_lines.append(self._text("tooltip_path", path=path_display))
+        return "\n".join(tooltip_lines)
+
     def _set_status_message(self, key: str, update_style: bool = True) -> None:
         self.current_status_key = key
         if hasattr(self, "status_label"):
-            self.status_label.setText(self._text(key))
+            # 文本未变化（重复设置同一状态）时不触发重绘
+            self._set_label_text(self.status_label, self._text(key))
             if update_style:
-                color = STATUS_COLORS.get(key, STATUS_COLORS["status_disconnected"])
-                self.status_label.setStyleSheet(f"color: {color};")
+                self._apply_status_style(STATUS_STYLESHEETS.get(key, STATUS_STYLESHEETS["status_disconnected"]))
+
+    def _apply_status_style(self, stylesheet: str) -> None:
+        # 样式未变化时跳过 setStyleSheet，避免重新 polish
+        if stylesheet == self._status_stylesheet:
+            return
+        self._status_stylesheet = stylesheet
+        self.status_label.setStyleSheet(stylesheet)
 
     def _update_count_label(self) -> None:
         if hasattr(self, "count_label"):
-            self.count_label.setText(self._text("records_count", count=len(self.log_records)))
+            # 达到显示上限后计数不再变化，文本相同时跳过 setText
+            self._set_label_text(self.count_label, self._fmt_records_count(count=len(self.log_records)))
 
     def _update_measurement_count_label(self) -> None:
         """更新测量数据计数显示"""
         if hasattr(self, "measurement_count_label"):
-            self.measurement_count_label.setText(self._text("measurement_count", count=len(self.measurement_records)))
+            self._set_label_text(self.measurement_count_label, self._fmt_measurement_count(count=len(self.measurement_records)))
 
     def _translate_cable_field(self, key: str) -> str:
-        return translate_cable_field(self.current_language, key)
+        return self._cable_field_map.get(key, key)
 
     def _translate_cable_value(self, value: Any) -> str:
-        return translate_cable_value(self.current_language, value)
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return self._cable_value_map.get(value, value)
+        return str(value)
 
     def _update_table_headers(self) -> None:
-        if hasattr(self, "table"):
-            self.table.setHorizontalHeaderLabels([
+        if hasattr(self, "log_model"):
+            self.log_model.set_headers([
                 self._text("table_column_index"),
                 self._text("table_column_relative_time"),
                 self._text("table_column_type"),
@@ -395,7 +476,7 @@ class PDViewerWindow(QMainWindow):
         control_layout.addWidget(self.device_selector)
 
         self.refresh_devices_btn = QPushButton()
-        self.refresh_devices_btn.clicked.connect(self._populate_device_list)
+        self.refresh_devices_btn.clicked.connect(self._refresh_device_list)
         control_layout.addWidget(self.refresh_devices_btn)
 
         self.connect_btn = QPushButton()
@@ -428,6 +509,11 @@ class PDViewerWindow(QMainWindow):
         self.data_visualization_checkbox.toggled.connect(self._on_data_visualization_toggled)
         control_layout.addWidget(self.data_visualization_checkbox)
 
+        self.keep_all_records_checkbox = QCheckBox()
+        self.keep_all_records_checkbox.setTristate(False)
+        self.keep_all_records_checkbox.toggled.connect(self._on_keep_all_records_toggled)
+        control_layout.addWidget(self.keep_all_records_checkbox)
+
         self.auto_pause_btn = QPushButton(self._text("btn_auto_pause_settings"))
         self.auto_pause_btn.clicked.connect(self._show_auto_pause_settings)
         control_layout.addWidget(self.auto_pause_btn)
@@ -454,23 +540,31 @@ class PDViewerWindow(QMainWindow):
         self.records_label.setStyleSheet("font-weight: bold;")
         records_layout.addWidget(self.records_label)
 
-        self.table = QTableWidget(0, 4)
+        self.log_model = LogTableModel(self.log_records, self)
+        self.log_model.set_summary_formatter(self._wrap_summary)
+
+        self.table = QTableView()
+        self.table.setModel(self.log_model)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.table.setWordWrap(True)
+        # 摘要已在 _wrap_summary 中按列宽换行，表格自身无需再做自动换行
+        self.table.setWordWrap(False)
         self.table.verticalHeader().setVisible(False)
+        # 行高统一由 setDefaultSectionSize 控制，插入行时不再逐行计算
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table.horizontalHeader().setStretchLastSection(True)
         header = self.table.horizontalHeader()
         header.setDefaultAlignment(Qt.AlignCenter)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        # 前三列只在首批记录到达时按内容调整一次宽度，之后可手动拖动
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
         # 确保序号列有足够的宽度
         self.table.setColumnWidth(0, 60)  # 设置序号列最小宽度为60像素
         header.sectionResized.connect(self._on_summary_column_resized)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         records_layout.addWidget(self.table, 1)
 
         self.splitter.addWidget(records_container)
@@ -560,6 +654,8 @@ class PDViewerWindow(QMainWindow):
         unified_chart.setBackgroundBrush(QBrush(QColor(30, 30, 35)))  # 与Base背景色一致
         unified_chart.setPlotAreaBackgroundBrush(QBrush(QColor(25, 25, 30)))  # 绘图区域稍微暗一些
         unified_chart.setPlotAreaBackgroundVisible(True)
+        # 曲线每次刷新都整体替换数据，不使用动画
+        unified_chart.setAnimationOptions(QChart.NoAnimation)
 
         # 设置图例样式（无背景、无边框）
         legend = unified_chart.legend()
@@ -625,13 +721,20 @@ class PDViewerWindow(QMainWindow):
         if self.summary_metrics:
             self.summary_char_px = max(6, self.summary_metrics.horizontalAdvance("0"))
             self.summary_line_height = max(16, self.summary_metrics.lineSpacing())
+        self._update_summary_wrap_chars()
         base_height = self.summary_line_height + self.summary_base_padding
         self.table.verticalHeader().setDefaultSectionSize(base_height)
+        # PDO/线缆表的内容都是单行短文本，固定行高，刷新时不再逐行测量
+        for side_table in (self.current_pdo_table, self.cable_info_table):
+            side_table.setWordWrap(False)
+            side_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            side_table.verticalHeader().setDefaultSectionSize(base_height)
 
         status_bar = self.statusBar()
 
         self.status_label = QLabel()
-        self.status_label.setStyleSheet(f"color: {STATUS_COLORS['status_disconnected']};")
+        self._status_stylesheet = ""
+        self._apply_status_style(STATUS_STYLESHEETS["status_disconnected"])
         status_bar.addWidget(self.status_label)
 
         status_bar.addPermanentWidget(QLabel(" | "))
@@ -668,28 +771,54 @@ class PDViewerWindow(QMainWindow):
         self.auto_pause_status_label.setToolTip(self._text("auto_pause_status_tooltip"))
         status_bar.addPermanentWidget(self.auto_pause_status_label)
 
+        # 内存占用标签在建界面时创建，由 _check_memory_usage 定时刷新
+        self._memory_label: Optional[QLabel] = None
+        if self._memory_process is not None:
+            status_bar.addPermanentWidget(QLabel(" | "))
+            self._memory_label = QLabel("RAM: --")
+            status_bar.addPermanentWidget(self._memory_label)
+
+        # 语言切换时需要重设文本的静态控件及其文本键
+        self._lang_targets: Tuple[Tuple[Any, str], ...] = (
+            (self.device_label, "label_device"),
+            (self.refresh_devices_btn, "btn_refresh_devices"),
+            (self.clear_btn, "btn_clear"),
+            (self.export_btn, "btn_export"),
+            (self.import_btn, "btn_import"),
+            (self.auto_scroll_checkbox, "checkbox_auto_scroll"),
+            (self.cable_label, "cable_title"),
+            (self.pdo_label, "pdo_title"),
+            (self.detail_label, "detail_title"),
+            (self.records_label, "records_title"),
+            (self.data_visualization_checkbox, "checkbox_data_visualization"),
+            (self.keep_all_records_checkbox, "checkbox_keep_all_records"),
+            (self.auto_pause_btn, "btn_auto_pause_settings"),
+        )
+
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str) -> None:
+        """文本相同时不调用 setText，避免无意义的重绘"""
+        if label.text() != text:
+            label.setText(text)
+
     def _update_measurement_display(self, voltage: Optional[float], current: Optional[float], power: Optional[float]) -> None:
         """Update voltage, current, and power displays in status bar."""
         if hasattr(self, "voltage_label"):
-            if voltage is not None:
-                text = self._text("measurement_display", value=voltage, unit="V")
-                self.voltage_label.setText(text)
-            else:
-                self.voltage_label.setText("--")
+            text = "--" if voltage is None else self._fmt_measurement_display(value=voltage, unit="V")
+            self._set_label_text(self.voltage_label, text)
 
         if hasattr(self, "current_label"):
-            if current is not None:
-                text = self._text("measurement_display", value=current, unit="A")
-                self.current_label.setText(text)
-            else:
-                self.current_label.setText("--")
+            text = "--" if current is None else self._fmt_measurement_display(value=current, unit="A")
+            self._set_label_text(self.current_label, text)
 
         if hasattr(self, "power_label"):
-            if power is not None:
-                text = self._text("measurement_display", value=power, unit="W")
-                self.power_label.setText(text)
-            else:
-                self.power_label.setText("--")
+            text = "--" if power is None else self._fmt_measurement_display(value=power, unit="W")
+            self._set_label_text(self.power_label, text)
+
+    def _refresh_device_list(self, _checked: bool = False) -> None:
+        # 手动刷新时丢弃缓存，强制重新枚举
+        self._enum_cache = None
+        self._populate_device_list()
 
     def _populate_device_list(self, _checked: bool = False) -> None:
         if not hasattr(self, "device_selector"):
@@ -708,9 +837,61 @@ class PDViewerWindow(QMainWindow):
             self.selected_device_value = None
             return
 
+        # 缓存有效期内直接用上次的枚举结果；否则在后台线程枚举，结果返回后再填充列表
+        cache = self._enum_cache
+        if cache is not None and time.monotonic() - cache[0] < DEVICE_ENUM_TTL_S:
+            self._apply_device_entries(self._build_device_entries(cache[1]))
+            return
+        self._start_device_enumeration()
+
+    def _start_device_enumeration(self) -> None:
+        if self._enum_thread is not None:
+            return  # 已有枚举在进行，结果返回时会刷新列表
+
+        worker = DeviceEnumWorker()
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_device_enum_finished)
+        worker.failed.connect(self._on_device_enum_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_device_enum_thread_finished)
+
+        self._enum_worker = worker
+        self._enum_thread = thread
+        if hasattr(self, "refresh_devices_btn"):
+            self.refresh_devices_btn.setEnabled(False)
+        thread.start()
+
+    def _on_device_enum_finished(self, enumerated: List[Dict[str, Any]]) -> None:
+        self._enum_cache = (time.monotonic(), enumerated)
+        self._apply_device_entries(self._build_device_entries(enumerated))
+        self._resume_pending_connect()
+
+    def _on_device_enum_failed(self, error: str) -> None:
+        print(self._text("log_get_devices_failed", detail=error))
+        self._apply_device_entries(self._build_device_entries([]))
+        self._resume_pending_connect()
+
+    def _resume_pending_connect(self) -> None:
+        # 枚举期间点击了连接：列表就绪后按当前选择继续连接
+        if not self._connect_after_enum:
+            return
+        self._connect_after_enum = False
+        if not self.device_open:
+            self._connect_device()
+
+    def _on_device_enum_thread_finished(self) -> None:
+        self._enum_worker = None
+        self._enum_thread = None
+
+    def _apply_device_entries(self, entries: List[Dict[str, Any]]) -> None:
         previous_value = self.selected_device_value
-        entries = self._get_available_devices()
         self.device_candidates = entries
+        self._device_labels_language = self.current_language
 
         self.device_selector.blockSignals(True)
         self.device_selector.clear()
@@ -726,7 +907,8 @@ class PDViewerWindow(QMainWindow):
             if previous_value is not None and value == previous_value:
                 selected_index = idx
 
-        if previous_value is None and len(entries) > 1:
+        # 未连接时默认选中第一个设备；已连接时保持连接所用的选择（包括自动选择）
+        if previous_value is None and len(entries) > 1 and not self.device_open:
             selected_index = 1
 
         self.device_selector.blockSignals(False)
@@ -737,27 +919,15 @@ class PDViewerWindow(QMainWindow):
             self.connect_btn.setEnabled(True)
 
         self.device_selector.setCurrentIndex(selected_index)
-        self._on_device_selected(selected_index)
-
-    def _get_available_devices(self) -> List[Dict[str, Any]]:
-        entries: List[Dict[str, Any]] = [
-            {
-                "label": self._text("device_auto"),
-                "value": None,
-                "tooltip": self._text("tooltip_default_vidpid", vid=K2_TARGET_VID, pid=K2_TARGET_PID),
-            }
-        ]
-
-        if not HID_AVAILABLE:
-            return entries
+        if not self.device_open:
+            self._on_device_selected(selected_index)
 
-        try:
-            enumerated = list(enumerate_devices())
-        except Exception as exc:
-            print(self._text("log_get_devices_failed", detail=exc))
-            enumerated = []
+    def _build_device_entries(self, enumerated: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """把 hid.enumerate 的结果转换为设备下拉框条目（首项为自动选择）"""
+        entries: List[Dict[str, Any]] = [{"label": self._text("device_auto"), "value": None}]
+        entries[0]["tooltip"] = self._render_entry_tooltip(entries[0])
 
-        for dev in enumerated or []:
+        for dev in enumerated:
             path = dev.get("path")
             if not path:
                 continue
@@ -777,13 +947,7 @@ class PDViewerWindow(QMainWindow):
                 label_parts.append(str(serial))
             label = " - ".join(label_parts) if label_parts else self._text("device_fallback_label", index=len(entries))
 
-            tooltip_lines = [self._text("tooltip_vid_pid", vid=vid, pid=pid)]
-            if manufacturer:
-                tooltip_lines.append(self._text("tooltip_manufacturer", manufacturer=manufacturer))
-            if product:
-                tooltip_lines.append(self._text("tooltip_product", product=product))
-            if serial:
-                tooltip_lines.append(self._text("tooltip_serial", serial=serial))
+            # 路径只在枚举时解码一次，语言切换时直接复用
             if isinstance(path, (bytes, bytearray)):
                 try:
                     path_display = path.decode("utf-8")
@@ -791,9 +955,8 @@ class PDViewerWindow(QMainWindow):
                     path_display = str(path)
             else:
                 path_display = str(path)
-            tooltip_lines.append(self._text("tooltip_path", path=path_display))
 
-            entries.append({
+            entry = {
                 "label": label,
                 "value": {
                     "path": path,
@@ -803,8 +966,10 @@ class PDViewerWindow(QMainWindow):
                     "manufacturer": manufacturer,
                     "product": product,
                 },
-                "tooltip": "\n".join(str(line) for line in tooltip_lines if line),
-            })
+                "path_display": path_display,
+            }
+            entry["tooltip"] = self._render_entry_tooltip(entry)
+            entries.append(entry)
 
         return entries
 
@@ -827,11 +992,10 @@ class PDViewerWindow(QMainWindow):
         if target_language == self.current_language:
             return
         self.current_language = target_language
+        # _apply_language 已刷新设备列表文本，无需重新枚举HID设备
         self._apply_language()
-        if not self.device_open:
+        if not self.device_candidates and not self.device_open:
             self._populate_device_list()
-        else:
-            self._refresh_device_selector_labels()
 
     def _on_data_visualization_toggled(self, checked: bool) -> None:
         if not hasattr(self, "chart_container") or not hasattr(self, "splitter"):
@@ -868,6 +1032,10 @@ class PDViewerWindow(QMainWindow):
 
         if HID_AVAILABLE and not self.device_candidates:
             self._populate_device_list()
+            if not self.device_candidates:
+                # 设备列表还在后台枚举：等结果返回、下拉框选好设备后再连接
+                self._connect_after_enum = True
+                return
 
         if self.log_records:
             reply = QMessageBox.question(
@@ -884,35 +1052,55 @@ class PDViewerWindow(QMainWindow):
         device_info = self._get_selected_device_info() if HID_AVAILABLE else None
 
         try:
-            self.data_queue = Queue(maxsize=1000)
+            self.frame_ring = FrameRing()
+            self.control_queue = Queue()
             self.stop_event = Event()
-            self.pause_flag = Value('i', 1)
+            self.pause_event = Event()
+            self.pause_event.set()  # 连接后默认暂停
 
             self.collection_process = Process(
                 target=data_collection_worker,
-                args=(self.data_queue, self.stop_event, self.pause_flag, device_info),
+                args=(self.frame_ring, self.control_queue, self.stop_event, self.pause_event, device_info),
                 daemon=True
             )
             self.collection_process.start()
 
             self.device_open = True
+            self.poll_timer.start()
             if hasattr(self, "start_btn"):
                 self.start_btn.setEnabled(True)
             if HID_AVAILABLE and hasattr(self, "device_selector"):
                 self.device_selector.setEnabled(False)
             if HID_AVAILABLE and hasattr(self, "refresh_devices_btn"):
                 self.refresh_devices_btn.setEnabled(False)
-            self._update_connect_button_text()
-            self._update_start_button_text()
+            self._sync_buttons()
             self._set_status_message("status_connected")
         except Exception as exc:
+            # 采集进程未能启动：释放已创建的共享内存和队列
+            self.collection_process = None
+            self._release_ipc_channels()
             if HID_AVAILABLE and hasattr(self, "device_selector"):
                 self.device_selector.setEnabled(True)
             if HID_AVAILABLE and hasattr(self, "refresh_devices_btn"):
                 self.refresh_devices_btn.setEnabled(True)
             QMessageBox.critical(self, self._text("dialog_error_title"), self._text("error_connection_failed", detail=exc))
 
+    def _release_ipc_channels(self) -> None:
+        if self.frame_ring:
+            self.frame_ring.close()
+            self.frame_ring.unlink()
+            self.frame_ring = None
+        if self.control_queue:
+            # 队列即将丢弃，直接关闭而不是逐条取出
+            self.control_queue.close()
+            self.control_queue.cancel_join_thread()
+            self.control_queue = None
+
     def _disconnect_device(self):
+        self.poll_timer.stop()
+        self.ui_update_timer.stop()
+        # 把最后一批尚未刷新的记录落到界面上
+        self._batch_update_ui()
         if self.stop_event:
             self.stop_event.set()
         if self.collection_process:
@@ -920,18 +1108,12 @@ class PDViewerWindow(QMainWindow):
             if self.collection_process.is_alive():
                 self.collection_process.terminate()
 
-        if self.data_queue:
-            try:
-                while True:
-                    self.data_queue.get_nowait()
-            except queue.Empty:
-                pass
+        self._release_ipc_channels()
 
         self.device_open = False
         self.is_paused = True
         self._cancel_auto_pause_delay()
-        self._update_connect_button_text()
-        self._update_start_button_text()
+        self._sync_buttons()
         if hasattr(self, "start_btn"):
             self.start_btn.setEnabled(False)
         self._set_status_message("status_disconnected")
@@ -953,17 +1135,17 @@ class PDViewerWindow(QMainWindow):
 
         if self.is_paused:
             self.is_paused = False
-            if self.pause_flag:
-                self.pause_flag.value = 0
+            if self.pause_event:
+                self.pause_event.clear()
             if self.start_time is None:
                 self.start_time = time.time()
             self._set_status_message("status_collecting")
         else:
             self.is_paused = True
-            if self.pause_flag:
-                self.pause_flag.value = 1
+            if self.pause_event:
+                self.pause_event.set()
             self._set_status_message("status_paused")
-        self._update_start_button_text()
+        self._sync_buttons()
 
     def _clear_records(self, confirm: bool = True) -> bool:
         if confirm:
@@ -991,35 +1173,65 @@ class PDViewerWindow(QMainWindow):
             return
         self._clear_records(confirm=False)
 
-    def _reset_records_state(self) -> None:
-        self.log_records.clear()
-        self.log_index = 0
-        self.measurement_records.clear()
-        self.measurement_index = 0
-
-        # 清空原始完整记录
-        self.raw_log_records.clear()
-        self.raw_measurement_records.clear()
+    def _on_keep_all_records_toggled(self, checked: bool) -> None:
+        # 勾选“保留全部记录”时取消原始记录上限（完整取证采集）
+        self.set_raw_record_limit(None if checked else RAW_RECORD_LIMIT)
+
+    def set_raw_record_limit(self, limit: Optional[int]) -> None:
+        """修改原始记录上限（None 表示不限制），保留最新的记录"""
+        self.raw_record_limit = limit
+        for name in ("raw_log_records", "raw_measurement_records"):
+            records = getattr(self, name)
+            if limit is not None and len(records) > limit:
+                self.raw_records_dropped += len(records) - limit
+            setattr(self, name, deque(records, maxlen=limit))
+
+    def _extend_raw_records(self, target: Deque[Any], records: List[Any]) -> None:
+        """追加到原始记录，并统计因上限被挤出的条数"""
+        maxlen = target.maxlen
+        if maxlen is not None:
+            overflow = len(target) + len(records) - maxlen
+            if overflow > 0:
+                self.raw_records_dropped += overflow
+        target.extend(records)
 
-        # 清空待处理的记录
-        self.pending_records.clear()
-        self.pending_measurements.clear()
+    def _reset_records_state(self) -> None:
+        with self._updates_suspended():
+            if hasattr(self, "log_model"):
+                self.log_model.clear()
+            else:
+                self.log_records.clear()
+            self.log_index = 0
+            self.measurement_records.clear()
+            self.measurement_index = 0
+            self._chart_dirty = True
+
+            # 清空原始完整记录
+            self.raw_log_records.clear()
+            self.raw_measurement_records.clear()
+            self.raw_records_dropped = 0
+
+            # 清空待处理的记录
+            self.pending_records.clear()
+            self.pending_measurements.clear()
 
-        self.start_time = None
-        self.current_max_lines = 1
-        if hasattr(self, "table"):
-            self.table.setRowCount(0)
-            base_height = self.summary_line_height + self.summary_base_padding
-            self.table.verticalHeader().setDefaultSectionSize(base_height)
-        if hasattr(self, "detail_text"):
-            self.detail_text.clear()
-        if hasattr(self, "current_pdo_table"):
-            self.current_pdo_table.setRowCount(0)
-        self._update_cable_info([])
-        self._update_count_label()
-        self._update_measurement_count_label()
-        # Reset measurement display
-        self._update_measurement_display(None, None, None)
+            self.start_time = None
+            self.current_max_lines = 1
+            self._table_columns_sized = False
+            if hasattr(self, "table"):
+                base_height = self.summary_line_height + self.summary_base_padding
+                self.table.verticalHeader().setDefaultSectionSize(base_height)
+            if hasattr(self, "detail_text"):
+                self.detail_text.clear()
+            self._detail_record = None
+            if hasattr(self, "current_pdo_table"):
+                self.current_pdo_table.setRowCount(0)
+            self._last_pdo_entries = []
+            self._update_cable_info([])
+            self._update_count_label()
+            self._update_measurement_count_label()
+            # Reset measurement display
+            self._update_measurement_display(None, None, None)
 
     def _export_csv(self):
         if not self.raw_log_records and not self.raw_measurement_records:
@@ -1029,78 +1241,83 @@ class PDViewerWindow(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(
             self,
             self._text("dialog_export_title"),
-            f"PD_Records_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            time.strftime("PD_Records_%Y%m%d_%H%M%S.csv"),
             self._text("file_filter_csv")
         )
         if not filename:
             return
 
+        def pd_rows():
+            join_parts = " | ".join
+            for record in self.raw_log_records:
+                relative_time = f"{record.relative_time:.3f}"
+                detail = ""
+                record_type = record.type
+                data = record.data
+
+                if record_type == 'PDO' and isinstance(data, list):
+                    detail = join_parts([
+                        f"PDO{entry.get('index', '?')}: {entry.get('summary', '')} [{entry.get('raw', '')}]"
+                        for entry in data
+                    ])
+                elif record_type == 'RDO' and isinstance(data, dict):
+                    parts = []
+                    if data.get('raw'):
+                        parts.append(f"Raw: {data['raw']}")
+                    if data.get('details'):
+                        parts.append(data['details'])
+                    detail = join_parts(parts)
+
+                yield (
+                    record.index,
+                    record.timestamp,
+                    relative_time,
+                    record_type,
+                    record.summary,
+                    detail
+                )
+
+        def measurement_rows():
+            for record in self.raw_measurement_records:
+                # 每个数值只格式化一次，摘要列和数值列共用
+                voltage = f"{record.voltage:.3f}"
+                current = f"{record.current:.3f}"
+                power = f"{record.power:.3f}"
+                yield (
+                    record.index,
+                    record.timestamp,
+                    f"{record.relative_time:.3f}",
+                    record.type,
+                    f"V:{voltage}V I:{current}A P:{power}W",
+                    "",
+                    voltage,
+                    current,
+                    power,
+                )
+
         try:
-            with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            with open(filename, 'w', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow([
-                    self._text("csv_header_index"),
-                    self._text("csv_header_absolute_time"),
-                    self._text("csv_header_relative_time"),
-                    self._text("csv_header_type"),
-                    self._text("csv_header_summary"),
-                    self._text("csv_header_details"),
-                    "Voltage(V)",  # 添加电压列
-                    "Current(A)",  # 添加电流列
-                    "Power(W)",    # 添加功率列
-                ])
-
-                # 导出PD记录（从原始完整记录导出）
-                for record in self.raw_log_records:
-                    relative_time = f"{record.get('relative_time', 0):.3f}"
-                    detail = ""
-
-                    if record['type'] == 'PDO' and isinstance(record.get('data'), list):
-                        detail_parts = []
-                        for entry in record['data']:
-                            detail_parts.append(
-                                f"PDO{entry.get('index', '?')}: "
-                                f"{entry.get('summary', '')} [{entry.get('raw', '')}]"
-                            )
-                        detail = " | ".join(detail_parts)
-                    elif record['type'] == 'RDO' and isinstance(record.get('data'), dict):
-                        parts = []
-                        if record['data'].get('raw'):
-                            parts.append(f"Raw: {record['data']['raw']}")
-                        if record['data'].get('details'):
-                            parts.append(record['data']['details'])
-                        detail = " | ".join(parts) if parts else ""
-
-                    writer.writerow([
-                        record['index'],
-                        record['timestamp'],
-                        relative_time,
-                        record['type'],
-                        record['summary'],
-                        detail
-                    ])
+                # 表头：本地化的基础列 + 电压/电流/功率列
+                writer.writerow(tuple(self._text(key) for key in CSV_HEADER_KEYS) + CSV_MEASUREMENT_HEADERS)
 
-                # 导出测量数据（从原始完整记录导出）
-                for record in self.raw_measurement_records:
-                    relative_time = f"{record.get('relative_time', 0):.3f}"
-                    writer.writerow([
-                        record['index'],
-                        record['timestamp'],
-                        relative_time,
-                        record['type'],
-                        f"V:{record['voltage']:.3f}V I:{record['current']:.3f}A P:{record['power']:.3f}W",
-                        "",
-                        f"{record['voltage']:.3f}",
-                        f"{record['current']:.3f}",
-                        f"{record['power']:.3f}",
-                    ])
+                # 导出PD记录和测量数据（从原始完整记录导出，逐行生成，一次性写入）
+                writer.writerows(pd_rows())
+                writer.writerows(measurement_rows())
 
             total_records = len(self.raw_log_records) + len(self.raw_measurement_records)
-            QMessageBox.information(self, self._text("dialog_export_success_title"), self._text("dialog_export_success", count=total_records))
+            message = self._text("dialog_export_success", count=total_records)
+            if self.raw_records_dropped:
+                # 原始记录达到上限后丢弃过最早的记录，导出文件不完整
+                message = f"{message}\n{self._text('dialog_export_capped', count=self.raw_records_dropped)}"
+            QMessageBox.information(self, self._text("dialog_export_success_title"), message)
         except Exception as exc:
             QMessageBox.critical(self, self._text("dialog_error_title"), self._text("dialog_export_failed", error=exc))
 
     def _import_csv(self):
+        if self._import_thread is not None:
+            return
+
         filename, _ = QFileDialog.getOpenFileName(
             self,
             self._text("dialog_import_title"),
@@ -1110,206 +1327,156 @@ class PDViewerWindow(QMainWindow):
         if not filename:
             return
 
-        try:
-            self._reset_records_state()
-
-            imported_count = 0
-
-            with open(filename, 'r', encoding='utf-8-sig') as csvfile:
-                reader = csv.reader(csvfile)
-                rows = list(reader)
-
-            header_variants = [
-                (
-                    LANG_STRINGS['zh']["csv_header_index"],
-                    LANG_STRINGS['zh']["csv_header_absolute_time"],
-                    LANG_STRINGS['zh']["csv_header_relative_time"],
-                    LANG_STRINGS['zh']["csv_header_type"],
-                    LANG_STRINGS['zh']["csv_header_summary"],
-                    LANG_STRINGS['zh']["csv_header_details"],
-                ),
-                (
-                    LANG_STRINGS['en']["csv_header_index"],
-                    LANG_STRINGS['en']["csv_header_absolute_time"],
-                    LANG_STRINGS['en']["csv_header_relative_time"],
-                    LANG_STRINGS['en']["csv_header_type"],
-                    LANG_STRINGS['en']["csv_header_summary"],
-                    LANG_STRINGS['en']["csv_header_details"],
-                ),
-            ]
-
-            if rows and tuple(rows[0]) in header_variants:
-                rows = rows[1:]
-
-            for row in rows:
-                if not row or len(row) < 5:
-                    continue
-
-                try:
-                    index = int(row[0])
-                    timestamp = row[1]
-                    relative_time = float(row[2])
-                    record_type = row[3]
-                    summary = row[4]
-                    detail_str = row[5] if len(row) > 5 else ''
-
-                    # 处理测量数据（如果有电压电流功率列）
-                    if len(row) > 8 and row[6] and row[7] and row[8]:
-                        try:
-                            voltage = float(row[6])
-                            current = abs(float(row[7]))
-                            power = float(row[8])
-
-                            # 添加测量数据记录（添加到原始完整记录）
-                            measurement_record = {
-                                "index": index,
-                                "timestamp": timestamp,
-                                "relative_time": relative_time,
-                                "type": "MEASUREMENT",
-                                "voltage": voltage,
-                                "current": current,
-                                "power": power
-                            }
-
-                            self.raw_measurement_records.append(measurement_record)
-                            # 检查UI记录限制
-                            if len(self.measurement_records) < self.ui_measurement_limit:
-                                self.measurement_records.append(measurement_record)
-
-                            self.measurement_index = max(self.measurement_index, index)
-                            imported_count += 1
-                            continue  # 跳过PD记录处理，这是测量数据
-                        except (ValueError, IndexError):
-                            pass  # 如果转换失败，继续作为PD记录处理
-
-                    data = None
-                    if record_type == 'PDO' and detail_str:
-                        data = []
-                        entries = detail_str.split(' | ')
-                        for entry in entries:
-                            if entry.startswith('PDO'):
-                                parts = entry.split(': ', 1)
-                                if len(parts) == 2:
-                                    pdo_index = parts[0].replace('PDO', '')
-                                    rest = parts[1]
-                                    if '[' in rest and ']' in rest:
-                                        summary_part = rest[:rest.rindex('[')].strip()
-                                        raw_part = rest[rest.rindex('[')+1:rest.rindex(']')]
-                                        data.append({
-                                            'index': pdo_index,
-                                            'summary': summary_part,
-                                            'raw': raw_part
-                                        })
-                    elif record_type == 'RDO' and detail_str:
-                        data = {}
-                        parts = detail_str.split(' | ')
-                        for part in parts:
-                            if part.startswith('Raw: '):
-                                data['raw'] = part.replace('Raw: ', '')
-                            elif part:
-                                data['details'] = part
-
-                    record = {
-                        "index": index,
-                        "timestamp": timestamp,
-                        "relative_time": relative_time,
-                        "type": record_type,
-                        "summary": summary,
-                        "data": data
-                    }
-
-                    self.raw_log_records.append(record)
-                    if len(self.log_records) < self.ui_log_limit:
-                        self.log_records.append(record)
-                        # 添加到表格
-                        self._add_record_to_table(record)
-
-                    self.log_index = max(self.log_index, index)
-                    imported_count += 1
-
-                except Exception as exc:
-                    print(self._text("log_skip_invalid_row", detail=exc))
-                    continue
-
-            self._update_count_label()
-            self._update_measurement_count_label()  # 更新测量数据计数
+        self._reset_records_state()
 
-            pd_count = len(self.log_records)
-            measurement_count = len(self.measurement_records)
-            total_count = pd_count + measurement_count
+        # 读取和解析在后台线程中进行，解析结果分批送回UI线程
+        worker = CsvImportWorker(filename, skip_message=self._text("log_skip_invalid_row"))
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.chunk_ready.connect(self._on_import_chunk)
+        worker.finished.connect(self._on_import_finished)
+        worker.failed.connect(self._on_import_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        worker.cancelled.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_import_thread_finished)
+
+        self._import_worker = worker
+        self._import_thread = thread
+        self.import_btn.setEnabled(False)
+        thread.start()
+
+    def _on_import_chunk(self, pd_records: List[LogRecord], measurement_records: List[MeasurementRecord]) -> None:
+        if measurement_records:
+            self._extend_raw_records(self.raw_measurement_records, measurement_records)
+            room = self.ui_measurement_limit - len(self.measurement_records)
+            if room > 0:
+                self.measurement_records.extend(measurement_records[:room])
+                self._chart_dirty = True
+            self.measurement_index = max(self.measurement_index, max(r.index for r in measurement_records))
+
+        if pd_records:
+            self._extend_raw_records(self.raw_log_records, pd_records)
+            room = self.ui_log_limit - len(self.log_records)
+            if room > 0:
+                self._append_records_to_table(pd_records[:room])
+                self._flush_table_view()
+            self.log_index = max(self.log_index, max(r.index for r in pd_records))
+
+    def _on_import_finished(self, imported_count: int, skipped_count: int = 0) -> None:
+        self._update_measurement_count_label()  # 更新测量数据计数
+        self._update_charts()
+
+        pd_count = len(self.log_records)
+        measurement_count = len(self.measurement_records)
+        total_count = pd_count + measurement_count
+
+        if measurement_count > 0:
+            message = f"成功导入 {total_count} 条记录 (PD: {pd_count}, 测量: {measurement_count})"
+        else:
+            message = self._text("dialog_import_success", count=imported_count)
+        if skipped_count:
+            message = f"{message}\n{self._text('dialog_import_skipped', count=skipped_count)}"
+        QMessageBox.information(self, self._text("dialog_import_success_title"), message)
 
-            if measurement_count > 0:
-                QMessageBox.information(self, self._text("dialog_import_success_title"),
-                    f"成功导入 {total_count} 条记录 (PD: {pd_count}, 测量: {measurement_count})")
-            else:
-                QMessageBox.information(self, self._text("dialog_import_success_title"), self._text("dialog_import_success", count=imported_count))
+    def _on_import_failed(self, error: str) -> None:
+        self._update_measurement_count_label()
+        QMessageBox.critical(self, self._text("dialog_error_title"), self._text("dialog_import_failed", error=error))
 
-        except Exception as exc:
-            QMessageBox.critical(self, self._text("dialog_error_title"), self._text("dialog_import_failed", error=exc))
+    def _on_import_thread_finished(self) -> None:
+        self._import_worker = None
+        self._import_thread = None
+        self.import_btn.setEnabled(True)
 
     def _poll_queue(self):
-        if not self.data_queue or not self.device_open:
+        if not self.frame_ring or not self.device_open:
             return
 
+        # 先一次性取出共享内存环形缓冲中的数据（单次上限，避免阻塞UI线程），再统一处理
+        batch: List[Dict[str, Any]] = []
+        backlog = False
+        try:
+            frames = self.frame_ring.get_all(self.max_payloads_per_poll)
+            backlog = len(frames) >= self.max_payloads_per_poll
+            batch = [decode_payload(frame) for frame in frames]
+        except Exception as exc:
+            print(f"处理数据错误: {exc}")
+
+        # 控制消息（错误等）很少，排在数据之后处理
         try:
             while True:
-                payload = self.data_queue.get_nowait()
-                self._handle_payload(payload)
+                batch.append(self.control_queue.get_nowait())
         except queue.Empty:
             pass
         except Exception as exc:
             print(f"处理数据错误: {exc}")
 
+        try:
+            for payload in batch:
+                self._handle_payload(payload)
+                if not self.device_open:
+                    break
+        except Exception as exc:
+            print(f"处理数据错误: {exc}")
+
+        # 有待显示的数据时安排一次批量刷新；积压越多等待越短
+        if (self.pending_records or self.pending_measurements) and not self.ui_update_timer.isActive():
+            pending_count = len(self.pending_records) + len(self.pending_measurements)
+            interval = max(UI_UPDATE_MIN_INTERVAL_MS, UI_UPDATE_MAX_INTERVAL_MS - pending_count * 3 // 10)
+            self.ui_update_timer.start(interval)
+
+        # 单次取满说明还有积压：先让出事件循环，再立即继续读取，不必等下一个定时周期
+        if backlog and self.device_open:
+            QTimer.singleShot(0, self._poll_queue)
+
     def _batch_update_ui(self):
-        """批量更新UI（每200ms执行一次，减少UI刷新频率）"""
+        """批量更新UI（收到数据后最多等待200ms合并执行一次，减少UI刷新频率）"""
         # 批量添加PD记录
         if self.pending_records:
-            # 取出所有待处理的记录
-            records_to_add = self.pending_records[:]
-            self.pending_records.clear()
-
-            # 添加到原始完整记录
-            self.raw_log_records.extend(records_to_add)
+            pending = self.pending_records
+            # 积压超过UI上限的部分插入后也会被滚动删除，只写入原始记录，不进表格
+            overflow = len(pending) - self.ui_log_limit
+            if overflow > 0:
+                self._extend_raw_records(self.raw_log_records, pending[:overflow])
+                pending = pending[overflow:]
 
-            # 检查是否需要滚动（如果达到UI限制）
-            if len(self.log_records) >= self.ui_log_limit:
-                # 滚动记录：移除旧的记录以保持UI限制
-                remove_count = len(self.log_records) + len(records_to_add) - self.ui_log_limit
-                if remove_count > 0:
-                    self.log_records = self.log_records[remove_count:]
-                    # 移除表格中的旧行
-                    self.table.setRowCount(max(0, self.table.rowCount() - remove_count))
+            # 每次最多插入 UI_BATCH_ROWS 条，其余留到下一轮，中间让出事件循环处理绘制和输入
+            records_to_add, self.pending_records = pending[:UI_BATCH_ROWS], pending[UI_BATCH_ROWS:]
 
-            # 添加到UI记录列表
-            self.log_records.extend(records_to_add)
+            # 添加到原始完整记录
+            self._extend_raw_records(self.raw_log_records, records_to_add)
 
-            # 批量添加到表格
-            for record in records_to_add:
-                self._add_record_to_table(record)
+            # 滚动记录：移除旧的记录以保持UI限制
+            remove_count = len(self.log_records) + len(records_to_add) - self.ui_log_limit
+            if remove_count > 0:
+                self.log_model.remove_leading(remove_count)
 
-            self._update_count_label()
+            # 批量添加到UI记录列表和表格
+            self._append_records_to_table(records_to_add)
 
         # 批量添加测量记录
         if self.pending_measurements:
-            measurements_to_add = self.pending_measurements[:]
-            self.pending_measurements.clear()
+            measurements_to_add, self.pending_measurements = self.pending_measurements, []
 
             # 添加到原始完整记录
-            self.raw_measurement_records.extend(measurements_to_add)
+            self._extend_raw_records(self.raw_measurement_records, measurements_to_add)
 
-            # 检查是否需要滚动测量记录
-            if len(self.measurement_records) >= self.ui_measurement_limit:
-                remove_count = len(self.measurement_records) + len(measurements_to_add) - self.ui_measurement_limit
-                if remove_count > 0:
-                    self.measurement_records = self.measurement_records[remove_count:]
-
-            # 添加到UI记录列表
+            # 添加到UI记录列表（deque 的 maxlen 负责滚动丢弃旧记录）
             self.measurement_records.extend(measurements_to_add)
+            self._chart_dirty = True
             self._update_measurement_count_label()
 
-            # 更新图表（如果有大量测量数据，限制更新频率）
-            if hasattr(self, "data_visualization_checkbox") and self.data_visualization_checkbox.isChecked():
-                self._update_charts()
+            # 更新图表（图表隐藏时跳过，重新显示时再绘制）
+            self._update_charts()
+
+        # 计数标签和自动滚动每个批次最多刷新一次
+        self._flush_table_view()
+
+        if self.pending_records:
+            QTimer.singleShot(0, self._batch_update_ui)
 
     def _handle_payload(self, payload: Dict[str, Any]):
         error_info = payload.get("error")
@@ -1339,8 +1506,8 @@ class PDViewerWindow(QMainWindow):
             self._last_current = current
             self._update_measurement_display(voltage, current, power)
 
-            # 检查自动暂停阈值（只有在收集状态下才检查）
-            if not self.is_paused and self.device_open:
+            # 检查自动暂停阈值（只有在启用且收集状态下才检查；关闭时设置函数已取消延时）
+            if self.auto_pause_threshold_enabled and not self.is_paused and self.device_open:
                 self._check_and_apply_auto_pause(voltage, current)
 
             # 记录测量数据（只有在收集状态下才记录）- 添加到待处理列表
@@ -1351,39 +1518,29 @@ class PDViewerWindow(QMainWindow):
                 if self.start_time is not None:
                     relative_time = time.time() - self.start_time
 
-                measurement_record = {
-                    "index": self.measurement_index,
-                    "timestamp": timestamp,
-                    "relative_time": relative_time,
-                    "type": "MEASUREMENT",
-                    "voltage": voltage,
-                    "current": current,
-                    "power": power
-                }
-                self.pending_measurements.append(measurement_record)
+                self.pending_measurements.append(
+                    MeasurementRecord(self.measurement_index, timestamp, relative_time, voltage, current, power)
+                )
 
         if self.is_paused:
             return
 
-        pkg = payload.get("data")
-        if pkg is None:
-            return
-
-        cable_rows = CableDataParser.parse(payload)
+        # PD数据包已在采集进程中解析完成
+        cable_rows = payload.get("cable_rows")
         if cable_rows:
             self._update_cable_info(cable_rows)
 
-        if is_pdo_packet(pkg):
-            pdo_data = PDParser.parse_pdo(payload)
-            if pdo_data is not None:
-                self._update_current_pdos(pdo_data)
+        pdo_data = payload.get("pdo_entries")
+        if pdo_data is not None:
+            self._update_current_pdos(pdo_data)
             if pdo_data:
-                summary = " | ".join(entry["summary"] for entry in pdo_data if entry["summary"].strip())
-                if summary.strip():
+                # 摘要在解析时已去除首尾空白，这里只需过滤空串
+                summary = " | ".join(entry["summary"] for entry in pdo_data if entry["summary"])
+                if summary:
                     self._add_record_to_pending(payload, "PDO", summary, pdo_data)
 
-        if is_rdo_packet(pkg):
-            rdo_info = PDParser.parse_rdo(payload)
+        rdo_info = payload.get("rdo_info")
+        if rdo_info is not None:
             summary = rdo_info.get("summary", "")
             if summary and summary != "Invalid RDO":
                 self._add_record_to_pending(payload, "RDO", summary, rdo_info)
@@ -1399,48 +1556,42 @@ class PDViewerWindow(QMainWindow):
         if self.start_time is not None:
             relative_time = time_sec - self.start_time
 
-        record = {
-            "index": self.log_index,
-            "timestamp": timestamp,
-            "relative_time": relative_time,
-            "type": record_type,
-            "summary": summary,
-            "data": data
-        }
-
-        self.pending_records.append(record)
-
-    def _add_record_to_table(self, record: Dict[str, Any]):
-        display_summary = self._wrap_summary(record["summary"])
-        num_lines = display_summary.count('\n') + 1
-        self.current_max_lines = max(self.current_max_lines, num_lines)
-
-        new_height = self.summary_line_height * self.current_max_lines + self.summary_base_padding
-        self.table.verticalHeader().setDefaultSectionSize(new_height)
-
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        index_item = QTableWidgetItem(str(record["index"]))
-        index_item.setTextAlignment(Qt.AlignCenter)
-        time_item = QTableWidgetItem(f"{record['relative_time']:.3f}")
-        time_item.setTextAlignment(Qt.AlignCenter)
-        type_item = QTableWidgetItem(record["type"])
-        type_item.setTextAlignment(Qt.AlignCenter)
-        summary_item = QTableWidgetItem(display_summary)
-        summary_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
-        for item in (index_item, time_item, type_item, summary_item):
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+        self.pending_records.append(
+            LogRecord(self.log_index, timestamp, relative_time, record_type, summary, data)
+        )
 
-        self.table.setItem(row, 0, index_item)
-        self.table.setItem(row, 1, time_item)
-        self.table.setItem(row, 2, type_item)
-        self.table.setItem(row, 3, summary_item)
+    def _append_records_to_table(self, records: List[LogRecord]):
+        """批量插入记录：一次行插入通知，统一行高；计数和滚动由 _flush_table_view 统一处理"""
+        if not records:
+            return
 
+        max_lines = self.current_max_lines
+        wrap = self._wrap_summary
+        for record in records:
+            line_count = wrap(record.summary).count('\n') + 1
+            if line_count > max_lines:
+                max_lines = line_count
+        if max_lines != self.current_max_lines:
+            self.current_max_lines = max_lines
+            new_height = self.summary_line_height * max_lines + self.summary_base_padding
+            self.table.verticalHeader().setDefaultSectionSize(new_height)
+
+        self.log_model.append_records(records)
+        self._table_view_dirty = True
+
+    def _flush_table_view(self) -> None:
+        """有新记录时才刷新计数标签并滚动到底部"""
+        if not self._table_view_dirty:
+            return
+        self._table_view_dirty = False
+        if not self._table_columns_sized and self.log_records:
+            self._table_columns_sized = True
+            for column in range(LogTableModel.SUMMARY_COLUMN):
+                self.table.resizeColumnToContents(column)
+            self.table.setColumnWidth(0, max(60, self.table.columnWidth(0)))
+        self._update_count_label()
         if hasattr(self, "auto_scroll_checkbox") and self.auto_scroll_checkbox.isChecked():
             self.table.scrollToBottom()
-        self.table.resizeRowToContents(row)
 
     def _update_count(self):
         self._update_count_label()
@@ -1449,65 +1600,46 @@ class PDViewerWindow(QMainWindow):
         """更新统一图表，显示测量数据"""
         if not hasattr(self, "voltage_series"):
             return
-
-        # 清空现有数据
-        self.voltage_series.clear()
-        self.current_series.clear()
-        self.power_series.clear()
+        # 图表不可见或数据自上次绘制后未变化时不重绘；脏标记保留到下次显示
+        if not self._chart_dirty or not self.chart_container.isVisible():
+            return
+        self._chart_dirty = False
 
         if not self.measurement_records:
+            # 没有数据时清空曲线
+            self.voltage_series.clear()
+            self.current_series.clear()
+            self.power_series.clear()
             return
 
-        # 限制显示的数据点数量，避免性能问题
-        max_points = 1000
         records = self.measurement_records
-        if len(records) > max_points:
-            # 取最新的max_points个点
-            step = len(records) // max_points + 1
-            records = records[::step]
-
-        # 添加数据点到图表
-        min_voltage = float('inf')
-        max_voltage = float('-inf')
-        min_current = float('inf')
-        max_current = float('-inf')
-        min_power = float('inf')
-        max_power = float('-inf')
 
         # 使用相对时间作为X轴数据
-        for record in records:
-            relative_seconds = record.get('relative_time', 0)
-            voltage = record.get('voltage', 0)
-            current = record.get('current', 0)
-            power = record.get('power', 0)
-
-            self.voltage_series.append(relative_seconds, voltage)
-            self.current_series.append(relative_seconds, current)
-            self.power_series.append(relative_seconds, power)
-
-            # 计算所有值的最小最大值
-            min_voltage = min(min_voltage, voltage)
-            max_voltage = max(max_voltage, voltage)
-            min_current = min(min_current, current)
-            max_current = max(max_current, current)
-            min_power = min(min_power, power)
-            max_power = max(max_power, power)
+        times = [record.relative_time for record in records]
+        voltages = [record.voltage for record in records]
+        currents = [record.current for record in records]
+        powers = [record.power for record in records]
 
-        # 设置X轴范围（相对时间）
-        if records:
-            first_relative = records[0].get('relative_time', 0)
-            last_relative = records[-1].get('relative_time', 0)
+        # 限制显示的数据点数量（约每像素一个点）：用 LTTB 降采样，保留尖峰和跳变
+        max_points = max(CHART_MIN_POINTS, self.unified_chart_view.width())
+
+        def series_points(values: List[float]) -> List[QPointF]:
+            return [QPointF(times[i], values[i]) for i in lttb_indices(times, values, max_points)]
 
-            self.unified_axis_x.setRange(first_relative, last_relative)
+        # 每条曲线整体替换一次，而不是逐点 append（每次 append 都会触发曲线重算和重绘）
+        self.voltage_series.replace(series_points(voltages))
+        self.current_series.replace(series_points(currents))
+        self.power_series.replace(series_points(powers))
+
+        # 设置X轴范围（相对时间）
+        self.unified_axis_x.setRange(times[0], times[-1])
 
         # 设置统一的Y轴范围（覆盖所有值）
         if hasattr(self, 'unified_axis_y'):
-            all_min = min(min_voltage, min_current, min_power)
-            all_max = max(max_voltage, max_current, max_power)
-
-            if all_min != float('inf') and all_max != float('-inf'):
-                margin = (all_max - all_min) * 0.1
-                self.unified_axis_y.setRange(all_min - margin, all_max + margin)
+            all_min = min(min(voltages), min(currents), min(powers))
+            all_max = max(max(voltages), max(currents), max(powers))
+            margin = (all_max - all_min) * 0.1
+            self.unified_axis_y.setRange(all_min - margin, all_max + margin)
 
     def _apply_auto_pause_settings(
         self,
@@ -1680,9 +1812,10 @@ class PDViewerWindow(QMainWindow):
             self._cancel_auto_pause_delay()
             return
 
-        metric = self.auto_pause_metric if self.auto_pause_metric in {"voltage", "current"} else "voltage"
-        threshold = self.voltage_threshold if metric == "voltage" else self.current_threshold
-        value = voltage if metric == "voltage" else current
+        if self.auto_pause_metric == "current":
+            metric, threshold, value = "current", self.current_threshold, current
+        else:
+            metric, threshold, value = "voltage", self.voltage_threshold, voltage
 
         if value is None:
             self._cancel_auto_pause_delay()
@@ -1742,7 +1875,7 @@ class PDViewerWindow(QMainWindow):
 
         self._set_status_message("status_paused", update_style=False)
         if hasattr(self, "status_label"):
-            self.status_label.setStyleSheet("color: #ff5555;")
+            self._apply_status_style(AUTO_PAUSED_STYLESHEET)
 
         metric_label = self._text("auto_pause_metric_voltage" if metric == "voltage" else "auto_pause_metric_current")
         unit = "V" if metric == "voltage" else "A"
@@ -1767,66 +1900,77 @@ class PDViewerWindow(QMainWindow):
 
         QMessageBox.information(self, self._text("dialog_info_title"), message)
 
+    @staticmethod
+    def _set_cell_text(table: QTableWidget, row: int, column: int, text: str,
+                       alignment=Qt.AlignLeft | Qt.AlignVCenter) -> None:
+        """复用已有单元格项，只在该位置还没有项时才新建"""
+        item = table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(alignment)
+            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            table.setItem(row, column, item)
+        else:
+            item.setText(text)
+
     def _update_current_pdos(self, entries: List[Dict[str, str]]) -> None:
         if not hasattr(self, "current_pdo_table"):
             return
 
-        self.current_pdo_table.setRowCount(len(entries))
-        for row, entry in enumerate(entries):
-            index_item = QTableWidgetItem(entry.get("index", ""))
-            index_item.setTextAlignment(Qt.AlignCenter)
-
-            summary_text = entry.get("summary", "")
-            summary_item = QTableWidgetItem(summary_text)
-
-            for item in (index_item, summary_item):
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-            self.current_pdo_table.setItem(row, 0, index_item)
-            self.current_pdo_table.setItem(row, 1, summary_item)
+        # 源端通常重复发送相同的PDO列表，只改写发生变化的行
+        previous = self._last_pdo_entries
+        if entries == previous:
+            return
 
-        if entries:
-            self.current_pdo_table.resizeRowsToContents()
+        table = self.current_pdo_table
+        if len(entries) != len(previous):
+            table.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            if row < len(previous) and previous[row] == entry:
+                continue
+            self._set_cell_text(table, row, 0, entry.get("index", ""), Qt.AlignCenter)
+            self._set_cell_text(table, row, 1, entry.get("summary", ""))
+        self._last_pdo_entries = list(entries)
 
     def _update_cable_info(self, entries: List[Tuple[str, Any]]) -> None:
         self.cable_info_rows = list(entries)
         if not hasattr(self, "cable_info_table"):
             return
 
-        self.cable_info_table.setRowCount(len(entries))
+        table = self.cable_info_table
+        table.setRowCount(len(entries))
         for row, (field_key, raw_value) in enumerate(entries):
-            field_text = self._translate_cable_field(field_key)
-            value_text = self._translate_cable_value(raw_value)
-
-            field_item = QTableWidgetItem(field_text)
-            field_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            field_item.setFlags(field_item.flags() & ~Qt.ItemIsEditable)
-
-            value_item = QTableWidgetItem(value_text)
-            value_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            value_item.setFlags(value_item.flags() & ~Qt.ItemIsEditable)
-
-            self.cable_info_table.setItem(row, 0, field_item)
-            self.cable_info_table.setItem(row, 1, value_item)
-
-        if entries:
-            self.cable_info_table.resizeRowsToContents()
+            self._set_cell_text(table, row, 0, self._translate_cable_field(field_key))
+            self._set_cell_text(table, row, 1, self._translate_cable_value(raw_value))
 
     def _wrap_summary(self, text: str) -> str:
         if not text:
             return ""
 
-        try:
-            summary_column_width = max(120, self.table.columnWidth(3))
-        except Exception:
-            summary_column_width = 300
-
-        char_px = max(6, self.summary_char_px)
-        self.summary_wrap_chars = max(12, summary_column_width // char_px)
-
+        # summary_wrap_chars 只在列宽变化时重新计算，这里直接使用
         effective_width = self.summary_wrap_chars
         max_lines = max(1, self.summary_max_lines)
 
+        cache_key = (effective_width, max_lines)
+        if cache_key != self._wrap_cache_key or len(self._wrap_cache) >= WRAP_CACHE_LIMIT:
+            self._wrap_cache.clear()
+            self._wrap_cache_key = cache_key
+        cached = self._wrap_cache.get(text)
+        if cached is not None:
+            return cached
+
+        wrapped = self._wrap_summary_text(text, effective_width, max_lines)
+        self._wrap_cache[text] = wrapped
+        return wrapped
+
+    @staticmethod
+    def _wrap_summary_text(text: str, effective_width: int, max_lines: int) -> str:
+        # 常见情况：单段短摘要放得下一行，直接返回，不进入换行状态机
+        segment = text.strip()
+        if (len(segment) <= effective_width and " | " not in text and "\t" not in segment
+                and len(segment.splitlines()) == 1):
+            return segment
+
         lines: List[str] = []
         current_line = ""
         truncated = False
@@ -1887,41 +2031,41 @@ class PDViewerWindow(QMainWindow):
 
         return "\n".join(lines)
 
+    def _update_summary_wrap_chars(self, column_width: Optional[int] = None) -> None:
+        """按摘要列宽和字符宽度换算每行字符数（字符宽度在建界面时测量一次）"""
+        if column_width is None:
+            try:
+                column_width = self.table.columnWidth(3)
+            except Exception:
+                column_width = 300
+        char_px = max(6, self.summary_char_px)
+        self.summary_wrap_chars = max(12, max(120, column_width) // char_px)
+
     def _on_summary_column_resized(self, _index: int, _old: int, _new: int):
-        if _index != 3 or self._updating_summary:
+        if _index != 3:
+            return
+        previous_chars = self.summary_wrap_chars
+        self._update_summary_wrap_chars(_new)
+        # 每行字符数没变时换行结果也不变，无需重排
+        if self._updating_summary or self.summary_wrap_chars == previous_chars:
             return
-        self._refresh_summary_wrapping()
+        self._summary_wrap_timer.start()
 
     def _refresh_summary_wrapping(self):
         if self._updating_summary:
             return
         self._updating_summary = True
         try:
-            items = self.table.rowCount()
-            if items == 0:
+            if not self.log_records:
                 return
 
             max_lines_found = 1
-            for row in range(items):
-                index_item = self.table.item(row, 0)
-                if not index_item:
-                    continue
-                try:
-                    record_index = int(index_item.text())
-                except ValueError:
-                    continue
-                record = next((r for r in self.log_records if r["index"] == record_index), None)
-                if not record:
-                    continue
-
-                display_summary = self._wrap_summary(record["summary"])
+            for record in self.log_records:
+                display_summary = self._wrap_summary(record.summary)
                 num_lines = display_summary.count('\n') + 1
                 max_lines_found = max(max_lines_found, num_lines)
 
-                summary_item = self.table.item(row, 3)
-                if summary_item and summary_item.text() != display_summary:
-                    summary_item.setText(display_summary)
-                    self.table.resizeRowToContents(row)
+            self.log_model.refresh_summaries()
 
             if max_lines_found != self.current_max_lines:
                 self.current_max_lines = max_lines_found
@@ -1930,42 +2074,42 @@ class PDViewerWindow(QMainWindow):
         finally:
             self._updating_summary = False
 
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_args):
         selected = self.table.selectionModel().selectedRows()
         if not selected:
             return
-        row = selected[0].row()
-        index_item = self.table.item(row, 0)
-        if not index_item:
+        record = self.log_model.record_at(selected[0].row())
+        if record is None:
             return
-        try:
-            record_index = int(index_item.text())
-        except ValueError:
+        # 滚动删除旧行时选择会随之变化，但若仍是同一条记录则保留现有文本（和滚动位置）
+        if record is self._detail_record and self._detail_language == self.current_language:
             return
+        self._detail_record = record
+        self._detail_language = self.current_language
+
+        details: List[str] = [
+            f"{self._text('detail_index')}: {record.index}",
+            f"{self._text('detail_time')}: {record.timestamp}",
+            f"{self._text('detail_relative_time')}: {self._text('detail_relative_seconds', seconds=record.relative_time)}",
+            f"{self._text('detail_type')}: {record.type}",
+            f"{self._text('detail_summary')}: {record.summary}",
+            "",
+        ]
 
-        record = next((r for r in self.log_records if r['index'] == record_index), None)
-        if not record:
-            return
-
-        details: List[str] = []
-        details.append(f"{self._text('detail_index')}: {record['index']}")
-        details.append(f"{self._text('detail_time')}: {record['timestamp']}")
-        details.append(f"{self._text('detail_relative_time')}: {self._text('detail_relative_seconds', seconds=record['relative_time'])}")
-        details.append(f"{self._text('detail_type')}: {record['type']}")
-        details.append(f"{self._text('detail_summary')}: {record['summary']}")
-        details.append("")
-
-        if record['type'] == 'PDO' and isinstance(record.get('data'), list):
+        data = record.data
+        if record.type == 'PDO' and isinstance(data, list):
             details.append(self._text('detail_pdo_header'))
-            for entry in record['data']:
-                details.append(f"  PDO{entry.get('index', '?')}: {entry.get('summary', '')}")
-                details.append(f"    {self._text('detail_raw')}: {entry.get('raw', '')}")
-        elif record['type'] == 'RDO' and isinstance(record.get('data'), dict):
+            raw_label = self._text('detail_raw')
+            details.extend(
+                f"  PDO{entry.get('index', '?')}: {entry.get('summary', '')}\n    {raw_label}: {entry.get('raw', '')}"
+                for entry in data
+            )
+        elif record.type == 'RDO' and isinstance(data, dict):
             details.append(self._text('detail_rdo_header'))
-            if record['data'].get('raw'):
-                details.append(f"  {self._text('detail_raw')}: {record['data']['raw']}")
-            if record['data'].get('details'):
-                details.append(f"  {self._text('detail_extra')}: {record['data']['details']}")
+            if data.get('raw'):
+                details.append(f"  {self._text('detail_raw')}: {data['raw']}")
+            if data.get('details'):
+                details.append(f"  {self._text('detail_extra')}: {data['details']}")
 
         self.detail_text.setPlainText("\n".join(details))
 
@@ -1985,6 +2129,17 @@ class PDViewerWindow(QMainWindow):
             self._disconnect_device()
 
     def closeEvent(self, event):  # noqa: N802
+        self._connect_after_enum = False  # 窗口关闭后不再执行被推迟的连接
+        if self._enum_thread is not None:
+            # 枚举无法中途取消，等待其结束；同样直接调用 quit()
+            self._enum_thread.quit()
+            self._enum_thread.wait()
+        if self._import_thread is not None:
+            # 关闭窗口时不等整个文件解析完：让导入线程在下一批处停止。
+            # 这里直接调用 quit()，因为 UI 线程阻塞在 wait() 中，排队的 quit 信号不会被处理
+            self._import_worker.cancel()
+            self._import_thread.quit()
+            self._import_thread.wait()
         self.poll_timer.stop()
         self.ui_update_timer.stop()
         self.memory_check_timer.stop()
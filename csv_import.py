@@ -0,0 +1,193 @@
+"""Background CSV import of exported EasyPD record logs."""
+
+from __future__ import annotations
+
+import csv
+import re
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from i18n import LANG_STRINGS
+from log_model import LogRecord, MeasurementRecord
+
+CSV_BUFFER_SIZE = 1 << 20  # CSV 导入导出的文件缓冲区大小
+IMPORT_CHUNK_SIZE = 500  # 每批发送给UI线程的记录数
+SKIP_LOG_LIMIT = 100  # 导入结束后最多输出的无效行原因条数
+
+CSV_HEADER_KEYS = (
+    "csv_header_index",
+    "csv_header_absolute_time",
+    "csv_header_relative_time",
+    "csv_header_type",
+    "csv_header_summary",
+    "csv_header_details",
+)
+
+CSV_MEASUREMENT_HEADERS = ("Voltage(V)", "Current(A)", "Power(W)")
+
+# 导出表头的各语言版本，导入时用于识别并跳过表头行
+_HEADER_VARIANTS = frozenset(
+    tuple(LANG_STRINGS[language][key] for key in CSV_HEADER_KEYS)
+    for language in LANG_STRINGS
+)
+
+# 导出格式 "PDO<index>: <summary> [<raw>]"；摘要本身可能含方括号，取最后一对作为原始值
+_PDO_ENTRY_RE = re.compile(r"PDO(.*?): (.*)\[(.*)\]")
+_RDO_RAW_PREFIX = 'Raw: '
+
+
+def _parse_pdo_detail(detail_str: str) -> List[Dict[str, str]]:
+    data: List[Dict[str, str]] = []
+    match_entry = _PDO_ENTRY_RE.match
+    for entry in detail_str.split(' | '):
+        match = match_entry(entry)
+        if match is not None:
+            pdo_index, summary_part, raw_part = match.groups()
+            data.append({
+                'index': pdo_index,
+                'summary': summary_part.strip(),
+                'raw': raw_part
+            })
+    return data
+
+
+def _parse_rdo_detail(detail_str: str) -> Dict[str, str]:
+    data: Dict[str, str] = {}
+    prefix_len = len(_RDO_RAW_PREFIX)
+    for part in detail_str.split(' | '):
+        if part.startswith(_RDO_RAW_PREFIX):
+            data['raw'] = part[prefix_len:]
+        elif part:
+            data['details'] = part
+    return data
+
+
+def parse_csv_row(row: Sequence[str]) -> Optional[Tuple[str, Any]]:
+    """Parse one exported row into ``("MEASUREMENT", MeasurementRecord)`` or ``("PD", LogRecord)``.
+
+    Returns None for rows that are too short; raises ValueError on malformed data.
+    """
+    if not row or len(row) < 5:
+        return None
+
+    index = int(row[0])
+    timestamp = row[1]
+    relative_time = float(row[2])
+    record_type = row[3]
+    summary = row[4]
+    detail_str = row[5] if len(row) > 5 else ''
+
+    # 处理测量数据（如果有电压电流功率列）
+    if len(row) > 8 and row[6] and row[7] and row[8]:
+        try:
+            return "MEASUREMENT", MeasurementRecord(
+                index, timestamp, relative_time, float(row[6]), abs(float(row[7])), float(row[8])
+            )
+        except (ValueError, IndexError):
+            pass  # 如果转换失败，继续作为PD记录处理
+
+    data: Any = None
+    if record_type == 'PDO' and detail_str:
+        data = _parse_pdo_detail(detail_str)
+    elif record_type == 'RDO' and detail_str:
+        data = _parse_rdo_detail(detail_str)
+
+    return "PD", LogRecord(index, timestamp, relative_time, record_type, summary, data)
+
+
+class CsvImportWorker(QObject):
+    """Reads and parses a CSV log in a worker thread.
+
+    Parsed records are streamed to the UI thread in chunks through
+    ``chunk_ready(pd_records, measurement_records)``; the file is never
+    materialized as a whole. ``finished(imported_count, skipped_count)``
+    reports the totals; reasons for skipped rows are logged once at the end.
+    ``cancel()`` may be called from the UI thread; the worker then stops at
+    the next chunk boundary and emits ``cancelled`` instead of ``finished``.
+    """
+
+    chunk_ready = Signal(list, list)
+    finished = Signal(int, int)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, filename: str, skip_message: str = "{detail}", chunk_size: int = IMPORT_CHUNK_SIZE):
+        super().__init__()
+        self._filename = filename
+        self._skip_message = skip_message
+        self._chunk_size = max(1, chunk_size)
+        self._cancel_requested = False
+
+    def cancel(self) -> None:
+        self._cancel_requested = True
+
+    @Slot()
+    def run(self) -> None:
+        imported_count = 0
+        skipped_count = 0
+        skip_details: List[str] = []
+        pd_chunk: List[LogRecord] = []
+        measurement_chunk: List[MeasurementRecord] = []
+        try:
+            with open(self._filename, 'r', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as csvfile:
+                reader = csv.reader(csvfile)
+                first_row = next(reader, None)
+                if first_row is None:
+                    self.finished.emit(0, 0)
+                    return
+                rows = reader
+                if tuple(first_row[:len(CSV_HEADER_KEYS)]) not in _HEADER_VARIANTS:
+                    rows = chain((first_row,), reader)
+
+                # 逐行循环里用到的属性和方法先绑定到局部变量
+                parse = parse_csv_row
+                chunk_size = self._chunk_size
+                emit_chunk = self.chunk_ready.emit
+                chunk_count = 0
+                for row in rows:
+                    try:
+                        parsed = parse(row)
+                    except Exception as exc:
+                        # 循环内不做输出，只记录原因（有上限），结束后统一打印
+                        skipped_count += 1
+                        if len(skip_details) < SKIP_LOG_LIMIT:
+                            skip_details.append(str(exc))
+                        continue
+                    if parsed is None:
+                        continue
+                    kind, record = parsed
+                    if kind == "MEASUREMENT":
+                        measurement_chunk.append(record)
+                    else:
+                        pd_chunk.append(record)
+                    imported_count += 1
+                    chunk_count += 1
+                    if chunk_count >= chunk_size:
+                        if self._cancel_requested:
+                            self.cancelled.emit()
+                            return
+                        emit_chunk(pd_chunk, measurement_chunk)
+                        pd_chunk, measurement_chunk = [], []
+                        chunk_count = 0
+
+            if pd_chunk or measurement_chunk:
+                self.chunk_ready.emit(pd_chunk, measurement_chunk)
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        if skip_details:
+            print("\n".join(self._skip_message.format(detail=detail) for detail in skip_details))
+        self.finished.emit(imported_count, skipped_count)
+
+
+__all__ = [
+    "CSV_BUFFER_SIZE",
+    "CSV_HEADER_KEYS",
+    "CSV_MEASUREMENT_HEADERS",
+    "IMPORT_CHUNK_SIZE",
+    "SKIP_LOG_LIMIT",
+    "CsvImportWorker",
+    "parse_csv_row",
+]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import queue
+import math
+import pickle
+import struct
 import time
 from typing import Any, Dict, Iterable, Optional
 
@@ -42,6 +44,45 @@ except ImportError:  # pragma: no cover - fallback when dependency missing
     K2_TARGET_PID = 0x0000
 
 
+# Measurement frames: fixed-size tag byte + voltage/current/power doubles
+# (NaN = missing). The UI timestamps measurements itself, so no timestamp is
+# carried. Pickle frames always start with 0x80, so the tag byte tells the two apart.
+_MEASUREMENT_TAG = b"M"
+_MEASUREMENT_FRAME = struct.Struct("<c3d")
+_MEASUREMENT_KEYS = ("voltage", "current", "power")
+
+
+def encode_measurement_frame(measurements: Dict[str, float]) -> bytes:
+    """Pack a measurement payload with a precompiled struct instead of pickle.
+
+    Measurement packets are the bulk of the traffic and always have the same
+    shape, so a fixed binary layout is cheaper to build and to read back.
+    """
+    nan = math.nan
+    get = measurements.get
+    return _MEASUREMENT_FRAME.pack(
+        _MEASUREMENT_TAG, get("voltage", nan), get("current", nan), get("power", nan)
+    )
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a decoded payload for the frame ring.
+
+    Payloads are small dicts of strings/floats with repeated keys; pickle's
+    highest protocol memoizes those keys and measured both faster and smaller
+    than msgpack for them.
+    """
+    return pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+
+
+def decode_payload(frame: bytes) -> Dict[str, Any]:
+    """Inverse of :func:`encode_payload` and :func:`encode_measurement_frame`."""
+    if frame[:1] == _MEASUREMENT_TAG:
+        _tag, *values = _MEASUREMENT_FRAME.unpack_from(frame)
+        return {"measurements": {key: value for key, value in zip(_MEASUREMENT_KEYS, values) if value == value}}
+    return pickle.loads(frame)
+
+
 def enumerate_devices() -> Iterable[Dict[str, Any]]:
     """Return devices matching the default VID/PID pair."""
     if not HID_AVAILABLE or hid is None:
@@ -102,10 +143,20 @@ def _open_with_info(device: WITRN_DEV, info: Optional[Any]) -> bool:
     return _attempt_open(device)
 
 
-def data_collection_worker(data_queue, stop_event, pause_flag, device_info=None):
+def data_collection_worker(frame_ring, control_queue, stop_event, pause_event, device_info=None):
     """
     Background process reading PD packets and measurements from the target device.
 
+    PD packets are decoded here rather than in the UI process, so payloads only
+    carry plain data: ``cable_rows``, ``pdo_entries`` and ``rdo_info`` for PD
+    packets, ``measurements`` for measurement packets.
+
+    Payloads are serialized once (:func:`encode_measurement_frame` for measurements,
+    :func:`encode_payload` otherwise) and written into ``frame_ring`` (a shared-memory
+    ``FrameRing``); a full ring drops the frame. Rare control messages such as
+    ``{"error": ...}`` go through ``control_queue``. ``pause_event`` is set while
+    collection is paused.
+
     This implementation based on witrn_pd_sniffer-3.7.1 design with the following improvements:
     1. Measurements (voltage, current, power) follow the same pause/resume control as PD packets
     2. Measurement refresh rate limited to 5 Hz (5 times per second) for better performance
@@ -114,7 +165,8 @@ def data_collection_worker(data_queue, stop_event, pause_flag, device_info=None)
     Data extraction uses dictionary-like access: pkg["Current"], pkg["VBus"]
     """
 
-    import struct
+    # Imported lazily: pd_decoder itself depends on this module.
+    from pd_decoder import CableDataParser, PDParser, is_pdo_packet, is_rdo_packet
 
     k2 = WITRN_DEV()
     last_measurement_timestamp = 0.0
@@ -134,12 +186,6 @@ def data_collection_worker(data_queue, stop_event, pause_flag, device_info=None)
                 if pkg is None:
                     continue
 
-                payload = {
-                    "timestamp": timestamp_str,
-                    "time_sec": time.time(),
-                    "data": pkg,
-                }
-
                 # Try to extract measurements from the package
                 measurements = {}
 
@@ -181,43 +227,50 @@ def data_collection_worker(data_queue, stop_event, pause_flag, device_info=None)
                 # PD packets
                 if is_pd_packet:
                     # Skip PD packets when paused
-                    if pause_flag.value == 1:
+                    if pause_event.is_set():
                         continue
-                    try:
-                        data_queue.put_nowait(payload)
-                    except queue.Full:
-                        pass
+                    # Sample the clock only for PD packets that may be sent (UI derives relative time)
+                    payload = {"timestamp": timestamp_str, "time_sec": time.time()}
+                    packet = {"data": pkg}
+                    cable_rows = CableDataParser.parse(packet)
+                    if cable_rows:
+                        payload["cable_rows"] = cable_rows
+                    if is_pdo_packet(pkg):
+                        payload["pdo_entries"] = PDParser.parse_pdo(packet)
+                    if is_rdo_packet(pkg):
+                        payload["rdo_info"] = PDParser.parse_rdo(packet)
+                    # Packets with nothing to display never leave the worker
+                    if cable_rows or "pdo_entries" in payload or "rdo_info" in payload:
+                        frame_ring.put(encode_payload(payload))
                 # Measurement packets or other data
                 elif measurements:
                     # Apply rate limiting: 5 Hz (0.2 seconds interval)
                     should_send_measurement = False
-                    if pause_flag.value == 0:  # Only send measurements when not paused
+                    if not pause_event.is_set():  # Only send measurements when not paused
                         now = time.time()
                         if now - last_measurement_timestamp >= 0.2:  # 5 Hz
                             should_send_measurement = True
                             last_measurement_timestamp = now
 
                     if should_send_measurement:
-                        payload["measurements"] = measurements
-                        try:
-                            data_queue.put_nowait(payload)
-                        except queue.Full:
-                            pass
+                        # The UI timestamps measurements itself, so the frame carries values only
+                        frame_ring.put(encode_measurement_frame(measurements))
 
             except Exception as exc:
                 err_text = str(exc).lower()
                 if "read error" in err_text:
-                    data_queue.put_nowait({"error": "device_disconnected"})
+                    control_queue.put_nowait({"error": "device_disconnected"})
                     break
                 time.sleep(0.01)
 
     except Exception as exc:
-        data_queue.put_nowait({"error": f"connection_failed: {exc}"})
+        control_queue.put_nowait({"error": f"connection_failed: {exc}"})
     finally:
         try:
             k2.close()
         except Exception:
             pass
+        frame_ring.close()
 
 
 __all__ = [
@@ -225,6 +278,9 @@ __all__ = [
     "K2_TARGET_VID",
     "K2_TARGET_PID",
     "enumerate_devices",
+    "encode_measurement_frame",
+    "encode_payload",
+    "decode_payload",
     "data_collection_worker",
     "is_pdo",
     "is_rdo",
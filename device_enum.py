@@ -0,0 +1,31 @@
+"""Background HID enumeration for the device selector."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from device_comm import enumerate_devices
+
+
+class DeviceEnumWorker(QObject):
+    """Runs ``hid.enumerate`` in a worker thread.
+
+    Enumeration can block for a noticeable time on some systems, so it is kept
+    off the UI thread. The raw hidapi entries are delivered through
+    ``finished(entries)``; errors are reported through ``failed(message)``.
+    """
+
+    finished = Signal(list)
+    failed = Signal(str)
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            entries = list(enumerate_devices())
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit(entries)
+
+
+__all__ = ["DeviceEnumWorker"]
@@ -0,0 +1,52 @@
+"""Chart point reduction for the measurement plot."""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """Pick ``threshold`` sample indices with Largest-Triangle-Three-Buckets.
+
+    Unlike a fixed stride, LTTB keeps the visually significant points (peaks,
+    dips, edges) of a curve. The first and last samples are always kept. When
+    ``threshold`` is at least the sample count (or below 3), every index is
+    returned. ``xs`` and ``ys`` must support slicing.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    indices = [0]
+    a = 0
+    for bucket in range(threshold - 2):
+        # Average of the following bucket is the third triangle vertex
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, n)
+        count = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / count
+        avg_y = sum(ys[avg_start:avg_end]) / count
+
+        range_start = int(bucket * every) + 1
+        range_end = int((bucket + 1) * every) + 1
+        ax = xs[a]
+        ay = ys[a]
+        dx = ax - avg_x
+        dy = avg_y - ay
+        max_area = -1.0
+        chosen = range_start
+        for j in range(range_start, range_end):
+            # Twice the triangle area; the constant factor does not change the argmax
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > max_area:
+                max_area = area
+                chosen = j
+        indices.append(chosen)
+        a = chosen
+
+    indices.append(n - 1)
+    return indices
+
+
+__all__ = ["lttb_indices"]
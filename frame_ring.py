@@ -0,0 +1,122 @@
+"""Shared-memory frame ring used between the collection process and the UI."""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+# Layout: [head u64][tail u64] padded to one cache line, followed by the byte arena.
+# head/tail are monotonically increasing byte offsets; only the producer writes
+# head and only the consumer writes tail, so no lock is needed (single producer,
+# single consumer).
+_HEADER_SIZE = 64
+_LENGTH_SIZE = 4
+_WRAP_MARKER = 0xFFFFFFFF
+
+DEFAULT_RING_CAPACITY = 4 * 1024 * 1024
+
+
+class FrameRing:
+    """Single-producer/single-consumer ring of length-prefixed byte frames."""
+
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY, name: Optional[str] = None):
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity)
+            self._shm.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._capacity = capacity
+        self._counters = self._shm.buf[:16].cast("Q")
+
+    def __getstate__(self):
+        # Child processes re-attach to the same block by name.
+        return {"name": self._shm.name, "capacity": self._capacity}
+
+    def __setstate__(self, state):
+        self.__init__(capacity=state["capacity"], name=state["name"])
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def put(self, data: bytes) -> bool:
+        """Append one frame; returns False (frame dropped) when the ring is full."""
+        size = len(data)
+        need = _LENGTH_SIZE + size
+        capacity = self._capacity
+        if need > capacity // 2:
+            return False
+
+        counters = self._counters
+        head = counters[0]
+        used = head - counters[1]
+        pos = head % capacity
+        skip = capacity - pos if capacity - pos < need else 0
+        if capacity - used < skip + need:
+            return False
+
+        buf = self._shm.buf
+        if skip:
+            if skip >= _LENGTH_SIZE:
+                struct.pack_into("<I", buf, _HEADER_SIZE + pos, _WRAP_MARKER)
+            head += skip
+            pos = 0
+
+        start = _HEADER_SIZE + pos
+        struct.pack_into("<I", buf, start, size)
+        buf[start + _LENGTH_SIZE:start + need] = data
+        # Publish only after the frame body is in place.
+        counters[0] = head + need
+        return True
+
+    def get_all(self, limit: Optional[int] = None) -> List[bytes]:
+        """Pop every available frame (at most ``limit``) in arrival order."""
+        counters = self._counters
+        head = counters[0]
+        tail = counters[1]
+        if tail == head:
+            return []
+
+        capacity = self._capacity
+        buf = self._shm.buf
+        frames: List[bytes] = []
+        while tail < head:
+            if limit is not None and len(frames) >= limit:
+                break
+            pos = tail % capacity
+            room = capacity - pos
+            if room < _LENGTH_SIZE:
+                tail += room
+                continue
+            start = _HEADER_SIZE + pos
+            (size,) = struct.unpack_from("<I", buf, start)
+            if size == _WRAP_MARKER:
+                tail += room
+                continue
+            frames.append(bytes(buf[start + _LENGTH_SIZE:start + _LENGTH_SIZE + size]))
+            tail += _LENGTH_SIZE + size
+
+        counters[1] = tail
+        return frames
+
+    def close(self) -> None:
+        """Detach this process from the shared block."""
+        if self._counters is None:
+            return
+        self._counters.release()
+        self._counters = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Release the shared block; call once, from the creating process."""
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+__all__ = [
+    "DEFAULT_RING_CAPACITY",
+    "FrameRing",
+]
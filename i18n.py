@@ -15,6 +15,8 @@ LANG_STRINGS: Dict[str, Dict[str, str]] = {
     "zh": {
         "app_title": "EasyPD",
         "checkbox_data_visualization": "数据可视化",
+        "checkbox_keep_all_records": "保留全部记录",
+        "tooltip_keep_all_records": "默认只保留最近 {limit} 条PD记录和 {limit} 条测量记录用于导出；勾选后不再丢弃旧记录（内存占用会持续增长）",
         "chart_title": "测量数据",
         "chart_axis_x": "相对时间 (秒)",
         "chart_axis_y": "数值 (多单位)",
@@ -68,9 +70,11 @@ LANG_STRINGS: Dict[str, Dict[str, str]] = {
         "dialog_import_title": "导入 CSV",
         "dialog_export_no_records": "没有可导出的记录",
         "dialog_export_success": "成功导出 {count} 条记录",
+        "dialog_export_capped": "注意：记录数曾超过保留上限，最早的 {count} 条记录已被丢弃，未包含在导出文件中。如需完整记录，请勾选“保留全部记录”。",
         "dialog_export_success_title": "成功",
         "dialog_export_failed": "导出失败: {error}",
         "dialog_import_success": "成功导入 {count} 条记录",
+        "dialog_import_skipped": "已跳过 {count} 条无效行",
         "dialog_import_success_title": "成功",
         "dialog_import_failed": "导入失败: {error}",
         "file_filter_csv": "CSV 文件 (*.csv);;所有文件 (*.*)",
@@ -145,6 +149,8 @@ LANG_STRINGS: Dict[str, Dict[str, str]] = {
     "en": {
         "app_title": "EasyPD",
         "checkbox_data_visualization": "Data Visualization",
+        "checkbox_keep_all_records": "Keep All Records",
+        "tooltip_keep_all_records": "By default only the latest {limit} PD records and {limit} measurements are kept for export. When checked, old records are never dropped (memory use keeps growing).",
         "chart_title": "Measurement Data",
         "chart_axis_x": "Relative Time (seconds)",
         "chart_axis_y": "Values (multiple units)",
@@ -198,9 +204,11 @@ LANG_STRINGS: Dict[str, Dict[str, str]] = {
         "dialog_import_title": "Import CSV",
         "dialog_export_no_records": "No records available for export.",
         "dialog_export_success": "Exported {count} records successfully.",
+        "dialog_export_capped": "Note: the record limit was reached, so the oldest {count} records were dropped and are not in this file. Check \"Keep All Records\" to keep a complete capture.",
         "dialog_export_success_title": "Success",
         "dialog_export_failed": "Export failed: {error}",
         "dialog_import_success": "Imported {count} records successfully.",
+        "dialog_import_skipped": "Skipped {count} invalid rows.",
         "dialog_import_success_title": "Success",
         "dialog_import_failed": "Import failed: {error}",
         "file_filter_csv": "CSV Files (*.csv);;All Files (*.*)",
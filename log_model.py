@@ -0,0 +1,143 @@
+"""Qt item model backing the PD record table."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, List, MutableSequence, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+@dataclass
+class LogRecord:
+    """One PD log entry (PDO/RDO); slotted to keep long captures compact."""
+
+    __slots__ = ("index", "timestamp", "relative_time", "type", "summary", "data")
+
+    index: int
+    timestamp: str
+    relative_time: float
+    type: str
+    summary: str
+    data: Any
+
+
+@dataclass
+class MeasurementRecord:
+    """One voltage/current/power sample; slotted like LogRecord since captures hold tens of thousands."""
+
+    __slots__ = ("index", "timestamp", "relative_time", "voltage", "current", "power")
+
+    type = "MEASUREMENT"
+
+    index: int
+    timestamp: str
+    relative_time: float
+    voltage: float
+    current: float
+    power: float
+
+
+class LogTableModel(QAbstractTableModel):
+    """Table model that renders PD log records straight from the shared record list.
+
+    The window keeps ``records`` as its ``log_records`` list; every mutation must
+    go through this model so the attached views are notified.
+    """
+
+    COLUMN_COUNT = 4
+    SUMMARY_COLUMN = 3
+
+    def __init__(self, records: MutableSequence[LogRecord], parent=None):
+        super().__init__(parent)
+        self._records = records
+        self._headers: List[str] = [""] * self.COLUMN_COUNT
+        self._summary_formatter: Callable[[str], str] = lambda text: text
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return len(self._records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return self.COLUMN_COUNT
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            record = self._records[index.row()]
+            if column == 0:
+                return str(record.index)
+            if column == 1:
+                return f"{record.relative_time:.3f}"
+            if column == 2:
+                return record.type
+            if column == self.SUMMARY_COLUMN:
+                return self._summary_formatter(record.summary)
+        elif role == Qt.TextAlignmentRole:
+            if column == self.SUMMARY_COLUMN:
+                return Qt.AlignLeft | Qt.AlignVCenter
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # noqa: N802
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < self.COLUMN_COUNT:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_headers(self, labels: Sequence[str]) -> None:
+        self._headers = list(labels)[:self.COLUMN_COUNT]
+        self._headers.extend([""] * (self.COLUMN_COUNT - len(self._headers)))
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def set_summary_formatter(self, formatter: Callable[[str], str]) -> None:
+        self._summary_formatter = formatter
+
+    def record_at(self, row: int) -> Optional[LogRecord]:
+        if 0 <= row < len(self._records):
+            return self._records[row]
+        return None
+
+    def append_records(self, records: Sequence[LogRecord]) -> None:
+        """Append a batch of records with a single row-insert notification."""
+        if not records:
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._records.extend(records)
+        self.endInsertRows()
+
+    def remove_leading(self, count: int) -> None:
+        """Drop the oldest ``count`` records (used for the UI rolling limit)."""
+        count = min(count, len(self._records))
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        popleft = getattr(self._records, "popleft", None)
+        if popleft is not None:
+            # deque: pop from the left without shifting the remaining rows
+            for _ in range(count):
+                popleft()
+        else:
+            del self._records[:count]
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._records.clear()
+        self.endResetModel()
+
+    def refresh_summaries(self) -> None:
+        """Re-render the summary column, e.g. after the wrap width changed."""
+        if not self._records:
+            return
+        top = self.index(0, self.SUMMARY_COLUMN)
+        bottom = self.index(len(self._records) - 1, self.SUMMARY_COLUMN)
+        self.dataChanged.emit(top, bottom, [Qt.DisplayRole])
+
+
+__all__ = ["LogRecord", "LogTableModel", "MeasurementRecord"]
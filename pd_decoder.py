@@ -8,13 +8,60 @@ from vendor_ids_dict import VENDOR_IDS
 
 from device_comm import is_pdo, is_rdo
 
+# VENDOR_IDS is keyed by "0xABCD" strings; index it once by integer VID.
+VENDOR_IDS_BY_INT: Dict[int, str] = {int(key, 16): name for key, name in VENDOR_IDS.items()}
+
+
+# (output key, VDO field name) tables for the cable extractors, in display order.
+PASSIVE_CABLE_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("cable_connector", "USB Type-C plug to USB Type-C/Captive (Passive Cable)"),
+    ("cable_termination", "Cable Termination Type (Passive Cable)"),
+    ("cable_max_voltage", "Maximum VBUS Voltage (Passive Cable)"),
+    ("cable_current", "VBUS Current Handling Capability (Passive Cable)"),
+    ("cable_highest_speed", "USB Highest Speed (Passive Cable)"),
+    ("cable_latency", "Cable Latency (Passive Cable)"),
+    ("cable_supports_epr", "EPR Capable (Passive Cable)"),
+)
+
+ACTIVE_CABLE_PRIMARY_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("cable_connector", "USB Type-C plug to USB Type-C/Captive"),
+    ("cable_termination", "Cable Termination Type (Active Cable)"),
+    ("cable_max_voltage", "Maximum VBUS Voltage (Active Cable)"),
+    ("cable_current", "VBUS Current Handling Capability (Active Cable)"),
+    ("cable_highest_speed", "USB Highest Speed (Active Cable)"),
+    ("cable_supports_epr", "EPR Capable (Active Cable)"),
+    ("cable_sbu", "SBU Supported"),
+)
+
+ACTIVE_CABLE_SECONDARY_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("cable_max_temp", "Maximum Operating Temperature"),
+    ("cable_shutdown_temp", "Shutdown Temperature"),
+    ("cable_usb4", "USB4 Supported"),
+)
+
+VPD_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("cable_max_voltage", "Maximum VBUS Voltage"),
+    ("cable_charge_through", "Charge Through Support"),
+    ("cable_charge_through_current", "Charge Through Current Support"),
+    ("cable_vbus_impedance", "VBUS Impedance"),
+    ("cable_ground_impedance", "Ground Impedance"),
+)
+
+
+# Message Type values form a small finite set, so each decision is computed once.
+_SINK_CAP_CACHE: Dict[Any, bool] = {}
+
 
 def is_sink_cap(pkg: Any) -> bool:
     """Return True if the packet looks like a Sink Capabilities message."""
     try:
         msg_type_value = pkg["Message Header"]["Message Type"].value()
-        normalized = str(msg_type_value).strip().lower()
-        return "sink" in normalized and "cap" in normalized
+        result = _SINK_CAP_CACHE.get(msg_type_value)
+        if result is None:
+            normalized = str(msg_type_value).strip().lower()
+            result = "sink" in normalized and "cap" in normalized
+            _SINK_CAP_CACHE[msg_type_value] = result
+        return result
     except Exception:
         return False
 
@@ -57,19 +104,25 @@ class PDParser:
             return entries
 
         for idx, obj in enumerate(data_objects):
+            # The helpers do not guard themselves; a failing summary must not cost the raw bits
             try:
                 if getattr(obj, "value", lambda: None)() == "Empty PDO":
                     continue
             except Exception:
                 pass
-
-            summary = PDParser._safe_quick_call(obj, "quick_pdo")
-            raw_bits = PDParser._safe_raw(obj)
+            try:
+                summary = PDParser._quick_call(obj, "quick_pdo")
+            except Exception:
+                summary = None
+            try:
+                raw_bits = PDParser._raw(obj)
+            except Exception:
+                raw_bits = ""
             raw_display = PDParser._bits_to_hex(raw_bits)
 
             entries.append({
                 "index": str(idx + 1),
-                "summary": summary or "",
+                "summary": summary.strip() if summary else "",
                 "raw": raw_display,
             })
 
@@ -95,12 +148,18 @@ class PDParser:
             return info
 
         target = data_objects[0]
-        summary = PDParser._safe_quick_call(target, "quick_rdo")
+        try:
+            summary = PDParser._quick_call(target, "quick_rdo")
+        except Exception:
+            summary = None
+        try:
+            raw_bits = PDParser._raw(target)
+        except Exception:
+            raw_bits = ""
 
         if not summary or summary == "Not a RDO":
             summary = "Invalid RDO"
 
-        raw_bits = PDParser._safe_raw(target)
         raw_display = PDParser._bits_to_hex(raw_bits)
 
         try:
@@ -118,31 +177,33 @@ class PDParser:
         return info
 
     @staticmethod
-    def _safe_raw(node: Any) -> str:
-        try:
-            return node.raw()
-        except Exception:
-            return ""
+    def _raw(node: Any) -> str:
+        # Only a missing method is handled here; callers guard against raising getters
+        raw = getattr(node, "raw", None)
+        return raw() if raw is not None else ""
 
     @staticmethod
     def _bits_to_hex(bit_str: str) -> str:
         if not bit_str:
             return ""
+        # witrnhid only exposes the bit string; PDOs/RDOs are almost always 32 bits
+        if len(bit_str) == 32:
+            try:
+                return "0x%08X" % int(bit_str, 2)
+            except (TypeError, ValueError):
+                return ""
         try:
-            value = int(bit_str, 2)
-            width = (len(bit_str) + 3) // 4
-            return f"0x{value:0{width}X}"
-        except Exception:
+            return "0x%0*X" % ((len(bit_str) + 3) >> 2, int(bit_str, 2))
+        except (TypeError, ValueError):
             return ""
 
     @staticmethod
-    def _safe_quick_call(node: Any, attr: str) -> Optional[str]:
-        try:
-            method = getattr(node, attr)
-            result = method()
-            return result if isinstance(result, str) else str(result)
-        except Exception:
+    def _quick_call(node: Any, attr: str) -> Optional[str]:
+        method = getattr(node, attr, None)
+        if method is None:
             return None
+        result = method()
+        return result if isinstance(result, str) else str(result)
 
 
 class CableDataParser:
@@ -187,6 +248,13 @@ class CableDataParser:
         if command != "Discover Identity" or command_type != "ACK":
             return None
 
+        # Index the VDOs once instead of rescanning the list per lookup
+        by_field: Dict[str, Any] = {}
+        for item in vdm_entries[1:]:
+            field_name = CableDataParser._field_of(item)
+            if field_name and field_name not in by_field:
+                by_field[field_name] = item
+
         info: List[Tuple[str, Any]] = []
 
         svid = CableDataParser._get_value(vdm_header, "SVID")
@@ -196,7 +264,7 @@ class CableDataParser:
         info.append(("cable_source", str(sop_value)))
         info.append(("cable_command", f"{command} ({command_type})"))
 
-        id_header = CableDataParser._find_by_field(vdm_entries, "ID Header VDO")
+        id_header = by_field.get("ID Header VDO")
         if id_header is not None:
             vid = CableDataParser._get_value(id_header, "USB Vendor ID")
             vendor_name = CableDataParser._resolve_vendor_name(vid)
@@ -212,7 +280,7 @@ class CableDataParser:
             if cable_role:
                 info.append(("cable_role", str(cable_role)))
 
-        product_vdo = CableDataParser._find_by_field(vdm_entries, "Product VDO")
+        product_vdo = by_field.get("Product VDO")
         if product_vdo is not None:
             product_id = CableDataParser._get_value(product_vdo, "USB Product ID")
             bcd_device = CableDataParser._get_value(product_vdo, "bcdDevice")
@@ -221,10 +289,10 @@ class CableDataParser:
             if bcd_device:
                 info.append(("cable_device_version", str(bcd_device).upper()))
 
-        passive_vdo = CableDataParser._find_by_field(vdm_entries, "Passive Cable VDO")
-        active_vdo_1 = CableDataParser._find_by_field(vdm_entries, "Active Cable VDO 1")
-        active_vdo_2 = CableDataParser._find_by_field(vdm_entries, "Active Cable VDO 2")
-        vpd_vdo = CableDataParser._find_by_field(vdm_entries, "VPD VDO")
+        passive_vdo = by_field.get("Passive Cable VDO")
+        active_vdo_1 = by_field.get("Active Cable VDO 1")
+        active_vdo_2 = by_field.get("Active Cable VDO 2")
+        vpd_vdo = by_field.get("VPD VDO")
 
         if passive_vdo is not None:
             info.append(("cable_type", "cable_type_passive"))
@@ -250,110 +318,77 @@ class CableDataParser:
 
     @staticmethod
     def _get_value(node: Any, field: str):
-        metadata_node = CableDataParser._get_metadata(node, field)
-        if metadata_node is None:
-            return None
+        # A missing field yields None (or a non-node) from witrnhid, so .value() raises
         try:
-            return metadata_node.value()
+            return node[field].value()
         except Exception:
             return None
 
     @staticmethod
-    def _find_by_field(items: List[Any], field_name: str):
-        for item in items:
-            if hasattr(item, "field") and item.field() == field_name:
-                return item
-        return None
+    def _children_by_field(node: Any) -> Dict[str, Any]:
+        # witrnhid rebuilds its field map on every node[...] lookup; build it once per VDO
+        try:
+            children = node.value()
+        except Exception:
+            return {}
+        if not isinstance(children, list):
+            return {}
+        by_field: Dict[str, Any] = {}
+        for child in children:
+            field_name = CableDataParser._field_of(child)
+            if field_name:
+                by_field[field_name] = child
+        return by_field
+
+    @staticmethod
+    def _field_of(item: Any) -> Optional[str]:
+        field = getattr(item, "field", None)
+        return field() if field is not None else None
 
     @staticmethod
     def _resolve_vendor_name(vid_value: Any) -> Optional[str]:
         if vid_value is None:
             return None
-        text = str(vid_value).strip()
-        candidates: List[Any] = [text, text.upper()]
-
-        upper_text = text.upper()
-        if upper_text.startswith("0X"):
-            candidates.append(upper_text[2:])
-        else:
-            candidates.append(f"0x{upper_text}")
-
+        if isinstance(vid_value, int):
+            return VENDOR_IDS_BY_INT.get(vid_value)
         try:
-            vid_int = int(text, 16)
+            # int(..., 16) accepts an optional "0x" prefix
+            vid_int = int(str(vid_value).strip(), 16)
         except (ValueError, TypeError):
-            vid_int = None
-
-        if vid_int is not None:
-            candidates.extend([vid_int, f"{vid_int:04X}", f"0x{vid_int:04X}"])
+            return None
+        return VENDOR_IDS_BY_INT.get(vid_int)
 
-        for candidate in candidates:
-            if candidate in VENDOR_IDS:
-                return VENDOR_IDS[candidate]
-        return None
+    @staticmethod
+    def _extract_fields(node: Any, fields: Tuple[Tuple[str, str], ...]) -> List[Tuple[str, Any]]:
+        rows: List[Tuple[str, Any]] = []
+        children = CableDataParser._children_by_field(node)
+        for key, field in fields:
+            child = children.get(field)
+            if child is None:
+                continue
+            # One failing field only drops its own row, not the whole packet
+            try:
+                value = CableDataParser._fmt(child.value())
+            except Exception:
+                continue
+            if value:
+                rows.append((key, value))
+        return rows
 
     @staticmethod
     def _extract_passive_info(node: Any) -> List[Tuple[str, Any]]:
-        rows: List[Tuple[str, Any]] = []
-        rows.append(("cable_connector", CableDataParser._fmt(CableDataParser._get_value(
-            node, "USB Type-C plug to USB Type-C/Captive (Passive Cable)"))))
-        rows.append(("cable_termination", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Cable Termination Type (Passive Cable)"))))
-        rows.append(("cable_max_voltage", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Maximum VBUS Voltage (Passive Cable)"))))
-        rows.append(("cable_current", CableDataParser._fmt(CableDataParser._get_value(
-            node, "VBUS Current Handling Capability (Passive Cable)"))))
-        rows.append(("cable_highest_speed", CableDataParser._fmt(CableDataParser._get_value(
-            node, "USB Highest Speed (Passive Cable)"))))
-        rows.append(("cable_latency", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Cable Latency (Passive Cable)"))))
-        rows.append(("cable_supports_epr", CableDataParser._fmt(CableDataParser._get_value(
-            node, "EPR Capable (Passive Cable)"))))
-        return [row for row in rows if row[1]]
+        return CableDataParser._extract_fields(node, PASSIVE_CABLE_FIELDS)
 
     @staticmethod
     def _extract_active_info(primary: Any, secondary: Any) -> List[Tuple[str, Any]]:
-        rows: List[Tuple[str, Any]] = []
-        rows.append(("cable_connector", CableDataParser._fmt(CableDataParser._get_value(
-            primary, "USB Type-C plug to USB Type-C/Captive"))))
-        rows.append(("cable_termination", CableDataParser._fmt(CableDataParser._get_value(
-            primary, "Cable Termination Type (Active Cable)"))))
-        rows.append(("cable_max_voltage", CableDataParser._fmt(CableDataParser._get_value(
-            primary, "Maximum VBUS Voltage (Active Cable)"))))
-        rows.append(("cable_current", CableDataParser._fmt(CableDataParser._get_value(
-            primary, "VBUS Current Handling Capability (Active Cable)"))))
-        rows.append(("cable_highest_speed", CableDataParser._fmt(CableDataParser._get_value(
-            primary, "USB Highest Speed (Active Cable)"))))
-        rows.append(("cable_supports_epr", CableDataParser._fmt(CableDataParser._get_value(
-            primary, "EPR Capable (Active Cable)"))))
-
-        sbu_supported = CableDataParser._get_value(primary, "SBU Supported")
-        if sbu_supported is not None:
-            rows.append(("cable_sbu", CableDataParser._fmt(sbu_supported)))
-
+        rows = CableDataParser._extract_fields(primary, ACTIVE_CABLE_PRIMARY_FIELDS)
         if secondary is not None:
-            rows.append(("cable_max_temp", CableDataParser._fmt(CableDataParser._get_value(
-                secondary, "Maximum Operating Temperature"))))
-            rows.append(("cable_shutdown_temp", CableDataParser._fmt(CableDataParser._get_value(
-                secondary, "Shutdown Temperature"))))
-            rows.append(("cable_usb4", CableDataParser._fmt(CableDataParser._get_value(
-                secondary, "USB4 Supported"))))
-
-        return [row for row in rows if row[1]]
+            rows.extend(CableDataParser._extract_fields(secondary, ACTIVE_CABLE_SECONDARY_FIELDS))
+        return rows
 
     @staticmethod
     def _extract_vpd_info(node: Any) -> List[Tuple[str, Any]]:
-        rows: List[Tuple[str, Any]] = []
-        rows.append(("cable_max_voltage", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Maximum VBUS Voltage"))))
-        rows.append(("cable_charge_through", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Charge Through Support"))))
-        rows.append(("cable_charge_through_current", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Charge Through Current Support"))))
-        rows.append(("cable_vbus_impedance", CableDataParser._fmt(CableDataParser._get_value(
-            node, "VBUS Impedance"))))
-        rows.append(("cable_ground_impedance", CableDataParser._fmt(CableDataParser._get_value(
-            node, "Ground Impedance"))))
-        return [row for row in rows if row[1]]
+        return CableDataParser._extract_fields(node, VPD_FIELDS)
 
     @staticmethod
     def _fmt(value: Any) -> Any: